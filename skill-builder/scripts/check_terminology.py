@@ -23,8 +23,11 @@ import json
 from pathlib import Path
 from collections import Counter
 from dataclasses import dataclass, asdict, field
+from functools import lru_cache
 from typing import Optional
 
+from validate_skill import read_skill_text
+
 # Try to import yaml, fall back gracefully
 try:
     import yaml
@@ -532,7 +535,7 @@ def get_adjusted_confidence(reason: str, modifier: float = 0.0) -> float:
     return max(0.0, min(1.0, adjusted))
 
 
-@dataclass
+@dataclass(slots=True)
 class TermOccurrence:
     """A single occurrence of a term with context."""
     line_number: int
@@ -540,7 +543,7 @@ class TermOccurrence:
     section: str
 
 
-@dataclass
+@dataclass(slots=True)
 class TermInfo:
     """Information about a term's usage."""
     term: str
@@ -549,7 +552,7 @@ class TermInfo:
     occurrences: list[TermOccurrence] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class CandidatePair:
     """A pair of terms that might be inconsistent."""
     term1: str
@@ -576,16 +579,30 @@ class TerminologyConfig:
 
 
 def load_config(config_path: Optional[Path] = None) -> TerminologyConfig:
-    """Load configuration from YAML file."""
-    config = TerminologyConfig()
+    """
+    Load configuration from YAML file.
 
+    Parsed configs are cached by path and modification time, so repeated
+    checks against an unchanged file parse it once. The returned config is
+    shared between callers and must not be modified.
+    """
     if config_path is None:
         # Look for default config in same directory as script
         script_dir = Path(__file__).parent
         config_path = script_dir / "terminology_config.yaml"
 
-    if not config_path.exists():
-        return config
+    try:
+        mtime_ns = config_path.stat().st_mtime_ns
+    except OSError:
+        return TerminologyConfig()
+
+    return _load_config_file(str(config_path), mtime_ns)
+
+
+@lru_cache(maxsize=8)
+def _load_config_file(config_path: str, mtime_ns: int) -> TerminologyConfig:
+    """Parse one config file; mtime_ns is part of the cache key only."""
+    config = TerminologyConfig()
 
     if not HAS_YAML:
         print(f"Warning: PyYAML not installed. Cannot load config from {config_path}", file=sys.stderr)
@@ -708,7 +725,7 @@ def extract_terms_with_context(content: str) -> tuple[Counter, dict[str, list[Te
     in_code_block = False
     processed_lines = []
     for line in lines:
-        if line.strip().startswith('```'):
+        if line.lstrip().startswith('```'):
             in_code_block = not in_code_block
             processed_lines.append('')
             continue
@@ -762,7 +779,7 @@ def extract_bigrams_with_context(content: str) -> tuple[Counter, dict[str, list[
     in_code_block = False
     processed_lines = []
     for line in lines:
-        if line.strip().startswith('```'):
+        if line.lstrip().startswith('```'):
             in_code_block = not in_code_block
             processed_lines.append('')
             continue
@@ -1119,9 +1136,13 @@ def find_levenshtein_similar(
     return candidates
 
 
-def check_terminology(skill_path: Path, config_path: Optional[Path] = None) -> dict:
+def check_terminology(skill_path: Path, config_path: Optional[Path] = None,
+                      text_cache: Optional[dict[Path, str]] = None) -> dict:
     """
     Run terminology checks and return structured results for LLM review.
+
+    text_cache maps paths to text already read by the caller; files found
+    there are not read from disk again.
     """
     # Load configuration
     config = load_config(config_path)
@@ -1138,7 +1159,8 @@ def check_terminology(skill_path: Path, config_path: Optional[Path] = None) -> d
     # Combine content from all files
     all_content = ""
     for f in md_files:
-        all_content += f.read_text() + "\n"
+        text = text_cache.get(f) if text_cache else None
+        all_content += (read_skill_text(f) if text is None else text) + "\n"
 
     # Extract terms with context
     term_counts, term_occurrences = extract_terms_with_context(all_content)
@@ -1200,6 +1222,7 @@ def check_terminology(skill_path: Path, config_path: Optional[Path] = None) -> d
             "config_loaded": config_path.name if config_path and config_path.exists() else "terminology_config.yaml (default)",
             "thresholds": {
                 "levenshtein_max_distance": 2,
+                "min_term_count": 1,
                 "min_term_length": 3,
                 "min_stem_length": 3,
             }
@@ -48,6 +48,7 @@ from check_terminology import (
     TerminologyConfig,
     STOPWORDS,
     KNOWN_ABBREVIATIONS,
+    HAS_YAML,
 )
 from collections import Counter
 
@@ -562,6 +563,24 @@ class TestFindLevenshteinSimilar:
         # Case variations are handled by find_case_variations
         assert len(candidates) == 0
 
+    def test_first_seen_term_listed_first(self):
+        """Pairs list terms in the order they were first seen."""
+        term_counts = Counter({"funciton": 1, "function": 6})
+        occurrences = {"funciton": [], "function": []}
+        candidates = find_levenshtein_similar(term_counts, occurrences, [], max_distance=2)
+
+        assert len(candidates) == 1
+        assert candidates[0].term1 == "funciton"
+        assert candidates[0].term2 == "function"
+
+    def test_first_seen_case_variant_reported(self):
+        """Of several case variants, the first one seen is paired."""
+        term_counts = Counter({"File": 1, "files": 2, "file": 5})
+        occurrences = {"File": [], "files": [], "file": []}
+        candidates = find_levenshtein_similar(term_counts, occurrences, [], max_distance=2)
+
+        assert [(c.term1, c.term2) for c in candidates] == [("File", "files")]
+
 
 # =============================================================================
 # check_terminology Integration Tests
@@ -627,6 +646,20 @@ The Config variant should also be noted.
             finally:
                 os.unlink(f.name)
 
+    def test_bom_and_crlf_read_like_plain_text(self):
+        """A byte order mark and CRLF line endings should not change the terms."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            plain = Path(tmpdir) / "plain" / "SKILL.md"
+            marked = Path(tmpdir) / "marked" / "SKILL.md"
+            plain.parent.mkdir()
+            marked.parent.mkdir()
+            content = "Setup the config.\nUpdate the Config here.\n"
+            plain.write_text(content)
+            marked.write_bytes(b'\xef\xbb\xbf' + content.replace("\n", "\r\n").encode())
+
+            expected = check_terminology(plain)["candidates_for_review"]
+            assert check_terminology(marked)["candidates_for_review"] == expected
+
     def test_metadata_included(self):
         """Result should include metadata."""
         content = "Some test content here."
@@ -737,6 +770,20 @@ class TestLoadConfig:
         assert config.version == "1.0"
         assert config.domain_abbreviations == {}
 
+    @pytest.mark.skipif(not HAS_YAML, reason="PyYAML not installed")
+    def test_config_reloaded_only_when_modified(self, tmp_path):
+        """Unchanged config files should be parsed once."""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text("ignore_terms:\n  - Foo\n")
+        first = load_config(config_path)
+        assert first.ignore_terms == ["foo"]
+        assert load_config(config_path) is first
+
+        config_path.write_text("ignore_terms:\n  - Bar\n")
+        stat = config_path.stat()
+        os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert load_config(config_path).ignore_terms == ["bar"]
+
     def test_config_structure(self):
         """Config should have expected structure."""
         config = TerminologyConfig()
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Unit tests for validate_all.py
+
+Tests cover:
+- JSON report encoding with and without orjson
+"""
+
+import json
+import pytest
+from pathlib import Path
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import validate_all
+from validate_all import _dumps
+
+
+# =============================================================================
+# _dumps Tests
+# =============================================================================
+
+class TestDumps:
+    """Tests for the _dumps JSON encoder."""
+
+    OUTPUT = {
+        "skill_path": "skill/SKILL.md",
+        "overall_passed": False,
+        "skill_issues": [{"message": "Found emoji: 👍", "context": "naïve café"}],
+        "summaries": [],
+        "metadata": {},
+    }
+
+    def test_without_orjson_matches_json(self, monkeypatch):
+        """Without orjson the output is exactly json.dumps(output, indent=2)."""
+        monkeypatch.setattr(validate_all, "HAS_ORJSON", False)
+        text = _dumps(self.OUTPUT)
+        assert text == json.dumps(self.OUTPUT, indent=2)
+        assert "\\ud83d\\udc4d" in text
+        assert text.isascii()
+
+    @pytest.mark.skipif(not validate_all.HAS_ORJSON, reason="orjson not installed")
+    def test_orjson_matches_json(self):
+        """With orjson the output is the same text, ASCII or not."""
+        ascii_output = {"skill_path": "skill", "summaries": [], "ok": True}
+        assert _dumps(ascii_output) == json.dumps(ascii_output, indent=2)
+        assert _dumps(self.OUTPUT) == json.dumps(self.OUTPUT, indent=2)
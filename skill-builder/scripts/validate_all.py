@@ -13,28 +13,45 @@ Usage:
     python validate_all.py ./my-skill/
     python validate_all.py ./my-skill/ --json
     python validate_all.py ./my-skill/ --config ./custom_terminology.yaml
+    python validate_all.py ./my-skill/ --fail-fast
 
 Output:
     Human-readable summary by default, or JSON with --json flag.
+
+--fail-fast stops syntax checks at the first file with errors and skips
+the terminology check when syntax validation fails.
 """
 
 import sys
 import json
+import argparse
+from operator import attrgetter
 from pathlib import Path
-from dataclasses import dataclass, field, asdict
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Iterator, Optional
+
+# orjson encodes large reports much faster; fall back to json without it
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 # Import the individual validators
 from validate_syntax import validate_syntax, validate_directory, SyntaxReport
-from validate_skill import validate_skill, ValidationReport
+from validate_skill import validate_skill, read_skill_text, ValidationReport
 from check_terminology import check_terminology, format_for_llm as format_terminology
+from check_terminology import VALIDATOR_VERSION as TERMINOLOGY_VERSION
 
 
 # Orchestrator metadata
 ORCHESTRATOR_VERSION = "1.0.0"
 
+_RULE = "=" * 70
+_THIN_RULE = "-" * 70
 
-@dataclass
+
+@dataclass(slots=True)
 class ValidatorSummary:
     """Summary of a single validator's results."""
     name: str
@@ -43,9 +60,23 @@ class ValidatorSummary:
     error_count: int
     warning_count: int
     review_count: int = 0  # For terminology candidates
+    skipped: bool = False  # Not run; see validate_all's fail_fast
+
 
+def _summary_to_dict(summary: ValidatorSummary) -> dict:
+    """Shallow dict of a summary; its fields are all scalars, so asdict's deep copy is not needed."""
+    return {
+        "name": summary.name,
+        "version": summary.version,
+        "passed": summary.passed,
+        "error_count": summary.error_count,
+        "warning_count": summary.warning_count,
+        "review_count": summary.review_count,
+        "skipped": summary.skipped,
+    }
 
-@dataclass
+
+@dataclass(slots=True)
 class UnifiedReport:
     """Combined report from all validators."""
     skill_path: str
@@ -58,63 +89,81 @@ class UnifiedReport:
     metadata: dict = field(default_factory=dict)
 
 
-def run_syntax_validation(skill_path: Path) -> tuple[ValidatorSummary, list[dict]]:
-    """Run syntax validation and return summary + issues."""
+def _dumps(output: dict) -> str:
+    """
+    Encode the JSON report with two-space indentation.
+
+    orjson writes non-ASCII text as UTF-8 where json escapes it, so its
+    output is used only when it is pure ASCII; the text is then the same
+    as json.dumps(output, indent=2).
+    """
+    if HAS_ORJSON:
+        text = orjson.dumps(output, option=orjson.OPT_INDENT_2).decode()
+        if text.isascii():
+            return text
+    return json.dumps(output, indent=2)
+
+
+def read_skill_files(skill_path: Path) -> dict[Path, str]:
+    """Read the markdown files the validators inspect, once, keyed by path."""
     if skill_path.is_dir():
-        reports = validate_directory(skill_path)
-        all_issues = []
-        total_errors = 0
-        total_warnings = 0
-        all_passed = True
-
-        for report in reports:
-            all_passed = all_passed and report.passed
-            total_errors += len(report.errors)
-            total_warnings += len(report.warnings)
-            for issue in report.issues:
-                all_issues.append({
-                    "file": str(report.file_path),
-                    "line": issue.line_number,
-                    "category": issue.category,
-                    "severity": issue.severity,
-                    "message": issue.message,
-                    "context": issue.context
-                })
+        paths = sorted(skill_path.glob("*.md"))
+    else:
+        paths = [skill_path]
+    return {path: read_skill_text(path) for path in paths if path.is_file()}
 
-        summary = ValidatorSummary(
-            name="validate_syntax.py",
-            version="1.0.0",
-            passed=all_passed,
-            error_count=total_errors,
-            warning_count=total_warnings
-        )
-        return summary, all_issues
+
+_ISSUE_FIELDS = attrgetter("line_number", "category", "severity", "message", "context")
+
+
+def _syntax_issue_dicts(report: SyntaxReport) -> Iterator[dict]:
+    """Yield a JSON-ready dict for each issue in a syntax report."""
+    file_path = str(report.file_path)
+    for line, category, severity, message, context in map(_ISSUE_FIELDS, report.issues):
+        yield {
+            "file": file_path,
+            "line": line,
+            "category": category,
+            "severity": severity,
+            "message": message,
+            "context": context
+        }
+
+
+def run_syntax_validation(skill_path: Path,
+                          text_cache: Optional[dict[Path, str]] = None,
+                          fail_fast: bool = False) -> tuple[ValidatorSummary, list[dict]]:
+    """Run syntax validation and return summary + issues."""
+    if skill_path.is_dir():
+        reports = validate_directory(skill_path, text_cache, fail_fast)
     else:
-        report = validate_syntax(skill_path)
-        issues = []
-        for issue in report.issues:
-            issues.append({
-                "file": str(report.file_path),
-                "line": issue.line_number,
-                "category": issue.category,
-                "severity": issue.severity,
-                "message": issue.message,
-                "context": issue.context
-            })
+        reports = [validate_syntax(skill_path, text_cache)]
 
-        summary = ValidatorSummary(
-            name="validate_syntax.py",
-            version="1.0.0",
-            passed=report.passed,
-            error_count=len(report.errors),
-            warning_count=len(report.warnings)
-        )
-        return summary, issues
+    all_issues = []
+    total_errors = 0
+    total_warnings = 0
+    all_passed = True
+
+    for report in reports:
+        all_passed = all_passed and report.passed
+        total_errors += len(report.errors)
+        total_warnings += len(report.warnings)
+        all_issues.extend(_syntax_issue_dicts(report))
+
+    summary = ValidatorSummary(
+        name="validate_syntax.py",
+        version="1.0.0",
+        passed=all_passed,
+        error_count=total_errors,
+        warning_count=total_warnings
+    )
+    return summary, all_issues
 
 
-def run_skill_validation(skill_path: Path) -> tuple[ValidatorSummary, list[dict]]:
+def run_skill_validation(skill_path: Path,
+                         text_cache: Optional[dict[Path, str]] = None) -> tuple[ValidatorSummary, list[dict]]:
     """Run skill structure/metadata validation and return summary + issues."""
-    report = validate_skill(skill_path)
+    report = validate_skill(skill_path, text_cache)
     issues = []
 
     for result in report.results:
@@ -135,9 +184,10 @@ def run_skill_validation(skill_path: Path) -> tuple[ValidatorSummary, list[dict]
     return summary, issues
 
 
-def run_terminology_check(skill_path: Path, config_path: Optional[Path] = None) -> tuple[ValidatorSummary, list[dict], dict]:
+def run_terminology_check(skill_path: Path, config_path: Optional[Path] = None,
+                          text_cache: Optional[dict[Path, str]] = None) -> tuple[ValidatorSummary, list[dict], dict]:
     """Run terminology checks and return summary + candidates + guidance."""
-    result = check_terminology(skill_path, config_path)
+    result = check_terminology(skill_path, config_path, text_cache)
 
     if "error" in result:
         summary = ValidatorSummary(
@@ -166,121 +216,155 @@ def run_terminology_check(skill_path: Path, config_path: Optional[Path] = None)
     return summary, candidates, guidance
 
 
-def format_human_readable(report: UnifiedReport) -> str:
-    """Format the unified report for human reading."""
-    output = []
+def _truncate(text: str, limit: int = 50) -> str:
+    """Shorten text to limit characters, marking the cut with '...'."""
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
+def _confidence_label(confidence: float) -> str:
+    """Label a candidate's adjusted confidence as in the report legend."""
+    if confidence >= 0.80:
+        return "HIGH"
+    if confidence >= 0.50:
+        return "MEDIUM"
+    return "LOW"
+
 
+def iter_report_lines(report: UnifiedReport) -> Iterator[str]:
+    """Yield the lines of the human-readable report, without newlines."""
     # Header
-    output.append("=" * 70)
-    output.append("UNIFIED SKILL VALIDATION REPORT")
-    output.append("=" * 70)
-    output.append(f"Skill: {report.skill_path}")
-    output.append(f"Orchestrator: validate_all.py v{ORCHESTRATOR_VERSION}")
-    output.append("")
+    yield _RULE
+    yield "UNIFIED SKILL VALIDATION REPORT"
+    yield _RULE
+    yield f"Skill: {report.skill_path}"
+    yield f"Orchestrator: validate_all.py v{ORCHESTRATOR_VERSION}"
+    yield ""
 
     # Quick summary
-    output.append("SUMMARY")
-    output.append("-" * 70)
+    yield "SUMMARY"
+    yield _THIN_RULE
     overall_status = "PASS" if report.overall_passed else "FAIL"
-    output.append(f"Overall Status: {overall_status}")
-    output.append("")
+    yield f"Overall Status: {overall_status}"
+    yield ""
 
     for summary in report.summaries:
+        if summary.skipped:
+            yield f"  {summary.name}: SKIPPED (syntax errors, --fail-fast)"
+            continue
         status = "PASS" if summary.passed else "FAIL"
         review_note = f", {summary.review_count} for review" if summary.review_count > 0 else ""
-        output.append(f"  {summary.name}: {status} ({summary.error_count} errors, {summary.warning_count} warnings{review_note})")
+        yield f"  {summary.name}: {status} ({summary.error_count} errors, {summary.warning_count} warnings{review_note})"
 
-    output.append("")
+    yield ""
 
     # Detailed issues by validator
     if report.syntax_issues:
-        output.append("SYNTAX ISSUES")
-        output.append("-" * 70)
+        yield "SYNTAX ISSUES"
+        yield _THIN_RULE
         for issue in report.syntax_issues:
             icon = "[ERROR]" if issue["severity"] == "error" else "[WARN]"
-            output.append(f"  {icon} {issue['file']}:{issue['line']} - {issue['category']}")
-            output.append(f"         {issue['message']}")
+            yield f"  {icon} {issue['file']}:{issue['line']} - {issue['category']}"
+            yield f"         {issue['message']}"
             if issue.get("context"):
-                ctx = issue["context"][:50] + "..." if len(issue["context"]) > 50 else issue["context"]
-                output.append(f"         Context: {ctx}")
-        output.append("")
+                ctx = _truncate(issue["context"])
+                yield f"         Context: {ctx}"
+        yield ""
 
     if report.skill_issues:
-        output.append("SKILL STRUCTURE ISSUES")
-        output.append("-" * 70)
+        yield "SKILL STRUCTURE ISSUES"
+        yield _THIN_RULE
         for issue in report.skill_issues:
             icon = "[ERROR]" if issue["severity"] == "error" else "[WARN]"
-            output.append(f"  {icon} {issue['check']}")
-            output.append(f"         {issue['message']}")
-        output.append("")
+            yield f"  {icon} {issue['check']}"
+            yield f"         {issue['message']}"
+        yield ""
 
     if report.terminology_candidates:
-        output.append("TERMINOLOGY CANDIDATES FOR REVIEW")
-        output.append("-" * 70)
-        output.append("The following term pairs may need consistency review.")
-        output.append("Confidence: 0.80+ HIGH (likely needs action), 0.50-0.79 MEDIUM, <0.50 LOW")
-        output.append("")
+        yield "TERMINOLOGY CANDIDATES FOR REVIEW"
+        yield _THIN_RULE
+        yield "The following term pairs may need consistency review."
+        yield "Confidence: 0.80+ HIGH (likely needs action), 0.50-0.79 MEDIUM, <0.50 LOW"
+        yield ""
 
         for i, candidate in enumerate(report.terminology_candidates, 1):
-            suggestion = f" (suggested: {candidate['suggestion']})" if candidate.get('suggestion') else ""
-            output.append(f"  {i}. \"{candidate['term1']}\" ({candidate['term1_count']}x) vs \"{candidate['term2']}\" ({candidate['term2_count']}x)")
-            output.append(f"     Reason: {candidate['reason']}{suggestion}")
+            get = candidate.get
+            term1 = candidate['term1']
+            term2 = candidate['term2']
+            suggestion = get('suggestion')
+            suggestion = f" (suggested: {suggestion})" if suggestion else ""
+            yield f"  {i}. \"{term1}\" ({candidate['term1_count']}x) vs \"{term2}\" ({candidate['term2_count']}x)"
+            yield f"     Reason: {candidate['reason']}{suggestion}"
 
             # Show confidence scores
-            base_conf = candidate.get('base_confidence', 0.0)
-            adj_conf = candidate.get('adjusted_confidence', 0.0)
-            modifiers = candidate.get('modifiers_applied', [])
-
-            if adj_conf >= 0.80:
-                conf_label = "HIGH"
-            elif adj_conf >= 0.50:
-                conf_label = "MEDIUM"
-            else:
-                conf_label = "LOW"
-
-            output.append(f"     Confidence: {adj_conf:.2f} ({conf_label})")
+            base_conf = get('base_confidence', 0.0)
+            adj_conf = get('adjusted_confidence', 0.0)
+            modifiers = get('modifiers_applied', ())
+
+            yield f"     Confidence: {adj_conf:.2f} ({_confidence_label(adj_conf)})"
             if modifiers:
                 modifier_delta = adj_conf - base_conf
                 sign = "+" if modifier_delta >= 0 else ""
-                output.append(f"       Base: {base_conf:.2f}, Adjusted: {sign}{modifier_delta:.2f} from: {', '.join(modifiers)}")
+                yield f"       Base: {base_conf:.2f}, Adjusted: {sign}{modifier_delta:.2f} from: {', '.join(modifiers)}"
 
             # Show occurrences
-            if candidate.get('term1_occurrences'):
-                output.append(f"     \"{candidate['term1']}\" appears in:")
-                for occ in candidate['term1_occurrences'][:2]:
-                    output.append(f"       - Line {occ['line_number']} ({occ['section']}): {occ['sentence'][:50]}...")
-
-            if candidate.get('term2_occurrences'):
-                output.append(f"     \"{candidate['term2']}\" appears in:")
-                for occ in candidate['term2_occurrences'][:2]:
-                    output.append(f"       - Line {occ['line_number']} ({occ['section']}): {occ['sentence'][:50]}...")
+            for term, occurrences in ((term1, get('term1_occurrences')),
+                                      (term2, get('term2_occurrences'))):
+                if occurrences:
+                    yield f"     \"{term}\" appears in:"
+                    for occ in occurrences[:2]:
+                        yield f"       - Line {occ['line_number']} ({occ['section']}): {occ['sentence'][:50]}..."
 
-            output.append("")
+            yield ""
 
         # Decision guidance
-        output.append("DECISION GUIDANCE")
-        output.append("-" * 70)
+        yield "DECISION GUIDANCE"
+        yield _THIN_RULE
         for reason, info in report.terminology_guidance.items():
-            output.append(f"  {reason}:")
-            output.append(f"    {info.get('description', '')}")
-            output.append(f"    Action: {info.get('typical_action', '')}")
-            output.append(f"    Exceptions: {info.get('exceptions', '')}")
-            output.append("")
+            get = info.get
+            yield f"  {reason}:"
+            yield f"    {get('description', '')}"
+            yield f"    Action: {get('typical_action', '')}"
+            yield f"    Exceptions: {get('exceptions', '')}"
+            yield ""
 
     # Final verdict
-    output.append("=" * 70)
-    output.append(f"FINAL VERDICT: {overall_status}")
+    yield _RULE
+    yield f"FINAL VERDICT: {overall_status}"
     if not report.overall_passed:
-        output.append("Fix all errors before proceeding.")
+        yield "Fix all errors before proceeding."
     if report.terminology_candidates:
-        output.append(f"Review {len(report.terminology_candidates)} terminology candidates for consistency.")
-    output.append("=" * 70)
+        yield f"Review {len(report.terminology_candidates)} terminology candidates for consistency."
+    yield _RULE
 
-    return "\n".join(output)
 
+def skipped_terminology_check() -> tuple[ValidatorSummary, list[dict], dict]:
+    """Summary + candidates + guidance for a terminology check that was not run."""
+    summary = ValidatorSummary(
+        name="check_terminology.py",
+        version=TERMINOLOGY_VERSION,
+        passed=True,  # Terminology never fails the overall check
+        error_count=0,
+        warning_count=0,
+        skipped=True
+    )
+    return summary, [], {}
 
-def validate_all(skill_path: Path, config_path: Optional[Path] = None) -> UnifiedReport:
-    """Run all validators and produce a unified report."""
+
+def format_human_readable(report: UnifiedReport) -> str:
+    """Format the unified report for human reading."""
+    return "\n".join(iter_report_lines(report))
+
+
+def validate_all(skill_path: Path, config_path: Optional[Path] = None,
+                 fail_fast: bool = False) -> UnifiedReport:
+    """
+    Run all validators and produce a unified report.
+
+    The markdown files are read once and shared by all three validators.
+    With fail_fast=True syntax validation of a directory stops at the
+    first file with errors, and the terminology check is skipped when
+    syntax validation fails, since the verdict is then FAIL either way.
+    """
     report = UnifiedReport(
         skill_path=str(skill_path),
         overall_passed=True,
@@ -291,22 +375,27 @@ def validate_all(skill_path: Path, config_path: Optional[Path] = None) -> Unifie
         }
     )
 
+    texts = read_skill_files(skill_path)
+
     # Run syntax validation
-    syntax_summary, syntax_issues = run_syntax_validation(skill_path)
+    syntax_summary, syntax_issues = run_syntax_validation(skill_path, texts, fail_fast)
     report.summaries.append(syntax_summary)
     report.syntax_issues = syntax_issues
     if not syntax_summary.passed:
         report.overall_passed = False
 
     # Run skill structure validation
-    skill_summary, skill_issues = run_skill_validation(skill_path)
+    skill_summary, skill_issues = run_skill_validation(skill_path, texts)
     report.summaries.append(skill_summary)
     report.skill_issues = skill_issues
     if not skill_summary.passed:
         report.overall_passed = False
 
     # Run terminology checks
-    term_summary, term_candidates, term_guidance = run_terminology_check(skill_path, config_path)
+    if fail_fast and not syntax_summary.passed:
+        term_summary, term_candidates, term_guidance = skipped_terminology_check()
+    else:
+        term_summary, term_candidates, term_guidance = run_terminology_check(skill_path, config_path, texts)
     report.summaries.append(term_summary)
     report.terminology_candidates = term_candidates
     report.terminology_guidance = term_guidance
@@ -315,43 +404,43 @@ def validate_all(skill_path: Path, config_path: Optional[Path] = None) -> Unifie
     return report
 
 
-def main():
-    if len(sys.argv) < 2:
-        print(__doc__)
-        sys.exit(1)
+_PARSER = argparse.ArgumentParser(
+    description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+_PARSER.add_argument("skill_path", type=Path, help="SKILL.md file or skill directory")
+_PARSER.add_argument("--config", type=Path, help="custom terminology config (YAML)")
+_PARSER.add_argument("--json", action="store_true", help="print the report as JSON")
+_PARSER.add_argument("--fail-fast", action="store_true",
+                     help="stop syntax checks at the first failing file and skip "
+                          "the terminology check when syntax validation fails")
 
-    skill_path = Path(sys.argv[1])
+
+def main():
+    args = _PARSER.parse_args()
+    skill_path = args.skill_path
 
     if not skill_path.exists():
         print(f"Error: Path not found: {skill_path}")
         sys.exit(1)
 
-    # Check for --config flag
-    config_path = None
-    if "--config" in sys.argv:
-        config_idx = sys.argv.index("--config")
-        if config_idx + 1 < len(sys.argv):
-            config_path = Path(sys.argv[config_idx + 1])
-
     # Run all validations
-    report = validate_all(skill_path, config_path)
+    report = validate_all(skill_path, args.config, fail_fast=args.fail_fast)
 
     # Output format
-    if "--json" in sys.argv:
+    if args.json:
         # Convert to JSON-serializable dict
         output = {
             "skill_path": report.skill_path,
             "overall_passed": report.overall_passed,
-            "summaries": [asdict(s) for s in report.summaries],
+            "summaries": [_summary_to_dict(s) for s in report.summaries],
             "syntax_issues": report.syntax_issues,
             "skill_issues": report.skill_issues,
             "terminology_candidates": report.terminology_candidates,
             "terminology_guidance": report.terminology_guidance,
             "metadata": report.metadata
         }
-        print(json.dumps(output, indent=2))
+        print(_dumps(output))
     else:
-        print(format_human_readable(report))
+        sys.stdout.writelines(f"{line}\n" for line in iter_report_lines(report))
 
     # Exit with appropriate code
     sys.exit(0 if report.overall_passed else 1)
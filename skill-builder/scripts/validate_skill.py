@@ -11,43 +11,175 @@ Usage:
     python validate_skill.py ./my-skill/  # Finds SKILL.md in directory
 """
 
+import os
 import re
 import sys
+from functools import lru_cache
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import Optional
-
-
-@dataclass
+from typing import Iterator, Optional
+
+
+# Common emoji ranges (inclusive), covering most Unicode emoji blocks
+_EMOJI_RANGES = (
+    (0x1F600, 0x1F64F),  # Emoticons
+    (0x1F300, 0x1F5FF),  # Misc Symbols and Pictographs
+    (0x1F680, 0x1F6FF),  # Transport and Map
+    (0x1F700, 0x1F77F),  # Alchemical Symbols
+    (0x1F780, 0x1F7FF),  # Geometric Shapes Extended
+    (0x1F800, 0x1F8FF),  # Supplemental Arrows-C
+    (0x1F900, 0x1F9FF),  # Supplemental Symbols and Pictographs
+    (0x1FA00, 0x1FA6F),  # Chess Symbols
+    (0x1FA70, 0x1FAFF),  # Symbols and Pictographs Extended-A
+    (0x02702, 0x027B0),  # Dingbats
+    (0x1F1E0, 0x1F1FF),  # Flags (iOS)
+)
+
+_EMOJI_RE = re.compile(
+    "[" + "".join(f"{chr(lo)}-{chr(hi)}" for lo, hi in _EMOJI_RANGES) + "]+",
+    flags=re.UNICODE
+)
+
+# Lowest emoji code point; anything below it (ASCII, Latin, Greek, ...) is never an emoji
+_EMOJI_FIRST = chr(min(lo for lo, _ in _EMOJI_RANGES))
+
+# One byte per code point up to the last emoji range; nonzero marks an emoji
+_EMOJI_TABLE = bytearray(max(hi for _, hi in _EMOJI_RANGES) + 1)
+for _lo, _hi in _EMOJI_RANGES:
+    _EMOJI_TABLE[_lo:_hi + 1] = b"\x01" * (_hi - _lo + 1)
+del _lo, _hi
+
+
+# Structure and TOC patterns
+_UTF8_BOM = b'\xef\xbb\xbf'
+
+# Whitespace after the opening '---'; see _frontmatter_body
+_SPACE_RUN_RE = re.compile(r'\s*')
+# One "key: value" line of frontmatter; lines starting with '#' (after indentation) are comments
+_FRONTMATTER_KV_RE = re.compile(r'^(?![^\S\n]*#)([^:\n]*):(.*)$', re.MULTILINE)
+_NAME_CHARS_RE = re.compile(r'^[a-z0-9-]+$')
+_FIRST_PERSON_RE = re.compile(r'\b(I|my|we|our)\b', re.IGNORECASE)
+_WINDOWS_PATH_RE = re.compile(r'[A-Za-z]:\\|\\\\')
+_TOC_HEADING_RE = re.compile(r'^##\s*(Contents|Table of Contents)\s*$', re.MULTILINE | re.IGNORECASE)
+_TOC_END_RE = re.compile(r'^(##\s+[^#]|---)', re.MULTILINE)
+# Neither part may span a line, which bounds how far a failed match can scan
+_TOC_LINK_RE = re.compile(r'\[([^\]\n]+)\]\(#([^)\n]+)\)')
+_HEADING_RE = re.compile(r'^(#{1,6})\s+(.+)$')
+_SLUG_STRIP_RE = re.compile(r'[^a-z0-9_-]')
+# Deletes every ASCII character _SLUG_STRIP_RE would remove
+_SLUG_DROP = str.maketrans('', '', ''.join(
+    c for c in map(chr, range(128)) if _SLUG_STRIP_RE.match(c)
+))
+_INLINE_EXAMPLE_RE = re.compile(r'##.*example|example:', re.IGNORECASE)
+_EXAMPLE_REF_RE = re.compile(r'\[.*?\]\([^)]*example[^)]*\.md\)', re.IGNORECASE)
+_IMPORT_RE = re.compile(r'(?:import|from|require)\s+(\w+)')
+_INSTALL_RE = re.compile(r'pip install|npm install|yarn add')
+
+
+# Allowed markdown extensions (anywhere in skill directory)
+_MARKDOWN_EXTENSIONS = frozenset({".md", ".markdown"})
+
+# Allowed script/code extensions (only in scripts/ directory)
+_SCRIPT_EXTENSIONS = frozenset({
+    # Python
+    ".py", ".pyi", ".pyw",
+    # JavaScript/TypeScript
+    ".js", ".ts", ".mjs", ".cjs", ".jsx", ".tsx",
+    # Shell
+    ".sh", ".bash", ".zsh", ".fish",
+    # Other languages
+    ".rb", ".go", ".rs", ".pl", ".php", ".lua", ".r", ".R",
+    # Config files
+    ".yaml", ".yml", ".json", ".toml", ".ini", ".cfg", ".conf",
+    # Data files that scripts might use
+    ".csv", ".txt",
+})
+
+# Directories to ignore entirely
+_IGNORED_DIRS = frozenset({
+    "__pycache__", ".git", ".svn", ".hg",
+    "node_modules", ".venv", "venv", ".env",
+    ".pytest_cache", ".mypy_cache", ".ruff_cache",
+    "dist", "build", ".tox", ".eggs",
+})
+
+# Files to ignore
+_IGNORED_FILES = frozenset({
+    ".gitignore", ".gitattributes", ".editorconfig",
+    ".DS_Store", "Thumbs.db",
+    "__init__.py",  # Allow __init__.py in scripts
+})
+
+
+@dataclass(slots=True)
 class ValidationResult:
     """Result of a single validation check."""
     name: str
     passed: bool
     message: str
     severity: str = "error"  # error, warning, info
+    # Short key for the kind of check (e.g. line_count, toc, file_exists, emoji)
+    category: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationReport:
-    """Complete validation report for a skill."""
+    """
+    Complete validation report for a skill.
+
+    Record results with add(), which keeps the severity and category
+    indexes in step with results.
+    """
     skill_name: str
     skill_path: Path
     results: list[ValidationResult] = field(default_factory=list)
+    # Failed results bucketed by severity as they are added
+    _errors: list[ValidationResult] = field(default_factory=list, init=False, repr=False)
+    _warnings: list[ValidationResult] = field(default_factory=list, init=False, repr=False)
+    # All results recorded under each category key; see category()
+    by_category: dict[str, list[ValidationResult]] = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self):
+        # Index results passed in at construction the same way add() does
+        results, self.results = self.results, []
+        for result in results:
+            self.add(result)
 
     def add(self, result: ValidationResult):
         self.results.append(result)
+        if result.category:
+            self.by_category.setdefault(result.category, []).append(result)
+        if not result.passed:
+            if result.severity == "error":
+                self._errors.append(result)
+            elif result.severity == "warning":
+                self._warnings.append(result)
+
+    def get(self, name: str) -> Optional[ValidationResult]:
+        """Return the latest result for a check name, or None if it never ran."""
+        for result in reversed(self.results):
+            if result.name == name:
+                return result
+        return None
+
+    def category(self, key: str) -> tuple[ValidationResult, ...]:
+        """Return the results recorded under a category key, or () if there are none."""
+        return tuple(self.by_category.get(key, ()))
+
+    def __contains__(self, name: str) -> bool:
+        return any(result.name == name for result in self.results)
 
     @property
     def passed(self) -> bool:
-        return all(r.passed for r in self.results if r.severity == "error")
+        return not self._errors
 
     @property
     def errors(self) -> list[ValidationResult]:
-        return [r for r in self.results if not r.passed and r.severity == "error"]
+        return list(self._errors)
 
     @property
     def warnings(self) -> list[ValidationResult]:
-        return [r for r in self.results if not r.passed and r.severity == "warning"]
+        return list(self._warnings)
 
     def print_report(self):
         status = "PASS" if self.passed else "FAIL"
@@ -58,20 +190,21 @@ class ValidationReport:
         print(f"Path: {self.skill_path}")
         print()
 
-        # Group by category
+        # Group by category, splitting each name once into (category, check)
         categories = {}
         for r in self.results:
-            cat = r.name.split(":")[0] if ":" in r.name else "General"
-            if cat not in categories:
-                categories[cat] = []
-            categories[cat].append(r)
+            cat, sep, _ = r.name.partition(":")
+            if sep:
+                check_name = r.name.rpartition(":")[2].strip()
+            else:
+                cat, check_name = "General", r.name
+            categories.setdefault(cat, []).append((check_name, r))
 
         for cat, results in categories.items():
             print(f"\n{cat}")
             print("-" * len(cat))
-            for r in results:
+            for check_name, r in results:
                 icon = "✓" if r.passed else "✗" if r.severity == "error" else "⚠"
-                check_name = r.name.split(":")[-1].strip() if ":" in r.name else r.name
                 print(f"  {icon} {check_name}: {r.message}")
 
         print()
@@ -82,29 +215,84 @@ class ValidationReport:
         print(f"VERDICT: {status}")
 
 
+@dataclass(frozen=True)
+class ParsedContent:
+    """Line view of a markdown document, shared by the validators that need lines."""
+    text: str
+    lines: list[str]
+    # (open, close) line indices of fenced code blocks; close is len(lines) if unclosed
+    fence_spans: list[tuple[int, int]]
+
+
+def _find_fences(lines: list[str]) -> list[tuple[int, int]]:
+    """Find fenced code blocks as (open, close) line index pairs."""
+    spans = []
+    open_index = None
+    for i, line in enumerate(lines):
+        if line.lstrip().startswith("```"):
+            if open_index is None:
+                open_index = i
+            else:
+                spans.append((open_index, i))
+                open_index = None
+    if open_index is not None:
+        spans.append((open_index, len(lines)))
+    return spans
+
+
+def parse_content(content: str) -> ParsedContent:
+    """
+    Split content into lines and locate code fences once.
+
+    validate_skill passes the result to the validators that need lines.
+    """
+    lines = content.split('\n')
+    return ParsedContent(content, lines, _find_fences(lines))
+
+
+def _frontmatter_body(content: str) -> Optional[str]:
+    r"""
+    Return the text between the frontmatter delimiters, or None.
+
+    Same result as matching r'^---\s*\n(.*?)\n---' with re.DOTALL, whose
+    backtracking is quadratic on an unclosed block with many blank lines
+    after the opening '---'. The body starts after the last newline in
+    the whitespace run and ends at the next '\n---'.
+    """
+    if not content.startswith('---'):
+        return None
+    run_end = _SPACE_RUN_RE.match(content, 3).end()
+    start = content.rfind('\n', 3, run_end)
+    if start < 0:
+        return None
+    end = content.find('\n---', start + 1)
+    if end >= 0:
+        return content[start + 1:end]
+    # No delimiter after the run; the run's own last newline can still close
+    # the block when '---' follows it directly
+    if start == run_end - 1 and content.startswith('---', run_end):
+        body_start = content.rfind('\n', 3, start)
+        if body_start >= 0:
+            return content[body_start + 1:start]
+    return None
+
+
 def parse_frontmatter(content: str) -> Optional[dict]:
     """
     Extract YAML frontmatter from skill file.
     Simple parser for key: value pairs. Handles quoted strings and multi-word values.
     """
-    match = re.match(r'^---\s*\n(.*?)\n---', content, re.DOTALL)
-    if not match:
+    body = _frontmatter_body(content)
+    if body is None:
         return None
 
     frontmatter = {}
-    for line in match.group(1).split('\n'):
-        line = line.strip()
-        if not line or line.startswith('#'):
-            continue
-        if ':' in line:
-            key, value = line.split(':', 1)
-            key = key.strip()
-            value = value.strip()
-            # Remove surrounding quotes if present
-            if (value.startswith('"') and value.endswith('"')) or \
-               (value.startswith("'") and value.endswith("'")):
-                value = value[1:-1]
-            frontmatter[key] = value
+    for key, value in _FRONTMATTER_KV_RE.findall(body):
+        value = value.strip()
+        # Remove surrounding quotes if present
+        if value[:1] in ('"', "'") and value.endswith(value[0]):
+            value = value[1:-1]
+        frontmatter[key.strip()] = value
     return frontmatter if frontmatter else None
 
 
@@ -116,7 +304,8 @@ def validate_metadata(content: str, report: ValidationReport):
         report.add(ValidationResult(
             "Metadata: Frontmatter",
             False,
-            "No YAML frontmatter found. Expected ---\\nname: ...\\ndescription: ...\\n---"
+            "No YAML frontmatter found. Expected ---\\nname: ...\\ndescription: ...\\n---",
+            category="frontmatter"
         ))
         return
 
@@ -127,27 +316,31 @@ def validate_metadata(content: str, report: ValidationReport):
         report.add(ValidationResult(
             "Metadata: Name present",
             False,
-            "Missing 'name' field in frontmatter"
+            "Missing 'name' field in frontmatter",
+            category="name_present"
         ))
     else:
         # Name format checks
         report.add(ValidationResult(
             "Metadata: Name length",
             len(name) <= 64,
-            f"Name is {len(name)} chars (max 64)"
+            f"Name is {len(name)} chars (max 64)",
+            category="name_length"
         ))
 
         report.add(ValidationResult(
             "Metadata: Name lowercase",
             name == name.lower(),
-            f"Name must be lowercase: '{name}'"
+            f"Name must be lowercase: '{name}'",
+            category="name_lowercase"
         ))
 
-        valid_chars = re.match(r'^[a-z0-9-]+$', name)
+        valid_chars = _NAME_CHARS_RE.match(name)
         report.add(ValidationResult(
             "Metadata: Name characters",
             bool(valid_chars),
-            "Name must contain only lowercase letters, numbers, and hyphens"
+            "Name must contain only lowercase letters, numbers, and hyphens",
+            category="name_chars"
         ))
 
         reserved = ["anthropic", "claude"]
@@ -155,7 +348,8 @@ def validate_metadata(content: str, report: ValidationReport):
         report.add(ValidationResult(
             "Metadata: No reserved words",
             not has_reserved,
-            f"Name must not contain reserved words: {reserved}"
+            f"Name must not contain reserved words: {reserved}",
+            category="reserved_words"
         ))
 
     # Check description
@@ -165,22 +359,25 @@ def validate_metadata(content: str, report: ValidationReport):
         report.add(ValidationResult(
             "Metadata: Description present",
             False,
-            "Missing 'description' field in frontmatter"
+            "Missing 'description' field in frontmatter",
+            category="description_present"
         ))
     else:
         report.add(ValidationResult(
             "Metadata: Description length",
             len(description) <= 1024,
-            f"Description is {len(description)} chars (max 1024)"
+            f"Description is {len(description)} chars (max 1024)",
+            category="description_length"
         ))
 
         # Check for first-person (I, my, we, our)
-        first_person = re.search(r'\b(I|my|we|our)\b', description, re.IGNORECASE)
+        first_person = _FIRST_PERSON_RE.search(description)
         report.add(ValidationResult(
             "Metadata: Third person",
             not first_person,
             "Description should use third person, not first person (I, my, we, our)",
-            severity="warning"
+            severity="warning",
+            category="third_person"
         ))
 
         # Check for trigger phrases
@@ -189,10 +386,12 @@ def validate_metadata(content: str, report: ValidationReport):
             "Metadata: Has triggers",
             has_trigger,
             "Description should include 'Use when...' trigger phrases",
-            severity="warning"
+            severity="warning",
+            category="triggers"
         ))
 
 
+@lru_cache(maxsize=2048)
 def heading_to_slug(heading: str) -> str:
     """
     Convert a markdown heading to a GitHub-compatible anchor slug.
@@ -203,23 +402,32 @@ def heading_to_slug(heading: str) -> str:
     - Remove characters that aren't alphanumeric, hyphens, or underscores
     - Remove leading/trailing hyphens
     """
-    slug = heading.lower()
-    slug = re.sub(r'\s+', '-', slug)
-    slug = re.sub(r'[^a-z0-9_-]', '', slug)
-    slug = slug.strip('-')
-    return slug
+    # str.split() breaks on the same whitespace runs as \s+; a leading or
+    # trailing run only ever produced a hyphen that strip('-') removes
+    slug = '-'.join(heading.lower().split())
+    if slug.isascii():
+        slug = slug.translate(_SLUG_DROP)
+    else:
+        slug = _SLUG_STRIP_RE.sub('', slug)
+    return slug.strip('-')
 
 
-def extract_headings(content: str) -> list[tuple[int, str, str]]:
+def extract_headings(content: str,
+                     parsed: Optional[ParsedContent] = None) -> list[tuple[int, str, str]]:
     """
     Extract all headings from markdown content.
 
     Returns list of tuples: (level, heading_text, slug)
     Level 1 = #, Level 2 = ##, etc.
+    parsed is content's ParsedContent when the caller already has it.
     """
+    if parsed is None:
+        parsed = parse_content(content)
     headings = []
-    for line in content.split('\n'):
-        match = re.match(r'^(#{1,6})\s+(.+)$', line)
+    for line in parsed.lines:
+        if not line.startswith('#'):
+            continue
+        match = _HEADING_RE.match(line)
         if match:
             level = len(match.group(1))
             text = match.group(2).strip()
@@ -228,7 +436,8 @@ def extract_headings(content: str) -> list[tuple[int, str, str]]:
     return headings
 
 
-def validate_toc(skill_path: Path, content: str, report: ValidationReport):
+def validate_toc(skill_path: Path, content: str, report: ValidationReport,
+                 parsed: Optional[ParsedContent] = None):
     """
     Validate table of contents format and link validity.
 
@@ -238,20 +447,21 @@ def validate_toc(skill_path: Path, content: str, report: ValidationReport):
     3. TOC anchor links point to actual headings in the document
 
     Note: Only applies to reference files, not SKILL.md itself.
+    parsed is content's ParsedContent when the caller already has it.
     """
     # Skip SKILL.md - TOC only required for reference files
     if skill_path.name.upper() == "SKILL.MD":
         return
 
-    lines = content.split('\n')
-    line_count = len(lines)
+    # Same count as len(content.split('\n')), without building the lines
+    line_count = content.count('\n') + 1
 
     # Only check files over 500 lines
     if line_count <= 500:
         return
 
     # Find TOC section
-    toc_match = re.search(r'^##\s*(Contents|Table of Contents)\s*$', content, re.MULTILINE | re.IGNORECASE)
+    toc_match = _TOC_HEADING_RE.search(content)
 
     if not toc_match:
         # Required (error) for 1000+ lines, warning for 500-999 lines
@@ -260,63 +470,74 @@ def validate_toc(skill_path: Path, content: str, report: ValidationReport):
                 "TOC: Presence",
                 False,
                 f"Files over 1000 lines ({line_count} lines) must have a '## Contents' or '## Table of Contents' section",
-                severity="error"
+                severity="error",
+                category="toc"
             ))
         else:
             report.add(ValidationResult(
                 "TOC: Presence",
                 False,
                 f"Files over 500 lines ({line_count} lines) should have a '## Contents' or '## Table of Contents' section",
-                severity="warning"
+                severity="warning",
+                category="toc"
             ))
         return
 
     report.add(ValidationResult(
         "TOC: Presence",
         True,
-        "Table of contents found"
+        "Table of contents found",
+        category="toc"
     ))
 
     # Extract all headings and their slugs
-    headings = extract_headings(content)
+    headings = extract_headings(content, parsed)
     valid_slugs = {slug for _, _, slug in headings}
 
     # Find TOC section content (from TOC heading to next ## heading or ---)
     toc_start = toc_match.end()
-    toc_end_match = re.search(r'^(##\s+[^#]|---)', content[toc_start:], re.MULTILINE)
-    toc_end = toc_start + toc_end_match.start() if toc_end_match else len(content)
+    # Searching from toc_start avoids copying the rest of the file; '^' still
+    # cannot match there, as the heading match always ends before a newline
+    toc_end_match = _TOC_END_RE.search(content, toc_start)
+    toc_end = toc_end_match.start() if toc_end_match else len(content)
     toc_section = content[toc_start:toc_end]
 
     # Extract TOC entries - links in format [text](#anchor)
-    toc_entries = re.findall(r'\[([^\]]+)\]\(#([^)]+)\)', toc_section)
+    toc_entries = _TOC_LINK_RE.findall(toc_section) if '](#' in toc_section else []
 
     if not toc_entries:
         report.add(ValidationResult(
             "TOC: Format",
             False,
             "TOC should contain markdown links in format [Section Name](#anchor)",
-            severity="warning"
+            severity="warning",
+            category="toc"
         ))
         return
 
     report.add(ValidationResult(
         "TOC: Format",
         True,
-        f"TOC contains {len(toc_entries)} entries with valid link format"
+        f"TOC contains {len(toc_entries)} entries with valid link format",
+        category="toc"
     ))
 
     # Validate each TOC entry links to an actual heading
     broken_links = []
+    slug_by_text = None
     for text, anchor in toc_entries:
         if anchor not in valid_slugs:
-            # Check if there's a close match (heading exists but slug doesn't match)
-            close_matches = [
-                (h_text, h_slug) for _, h_text, h_slug in headings
-                if h_text.lower() == text.lower() and h_slug != anchor
-            ]
-            if close_matches:
+            # Check if there's a close match (heading exists but slug doesn't match).
+            # Any heading slug differs from anchor here, so the first heading
+            # with the same text (case-insensitively) is the suggestion.
+            if slug_by_text is None:
+                slug_by_text = {}
+                for _, h_text, h_slug in headings:
+                    slug_by_text.setdefault(h_text.lower(), h_slug)
+            suggested = slug_by_text.get(text.lower())
+            if suggested is not None:
                 broken_links.append(
-                    f"[{text}](#{anchor}) - heading exists but anchor should be #{close_matches[0][1]}"
+                    f"[{text}](#{anchor}) - heading exists but anchor should be #{suggested}"
                 )
             else:
                 broken_links.append(f"[{text}](#{anchor}) - no matching heading found")
@@ -329,138 +550,269 @@ def validate_toc(skill_path: Path, content: str, report: ValidationReport):
             "TOC: Link validity",
             False,
             f"Broken TOC links: {link_list}{suffix}",
-            severity="warning"
+            severity="warning",
+            category="toc"
         ))
     else:
         report.add(ValidationResult(
             "TOC: Link validity",
             True,
-            f"All {len(toc_entries)} TOC links point to valid headings"
+            f"All {len(toc_entries)} TOC links point to valid headings",
+            category="toc"
         ))
 
 
-def extract_refs_outside_code_blocks(content: str) -> list[str]:
+def _strip_inline_code(line: str) -> str:
     """
-    Extract markdown file references that are NOT inside fenced code blocks or inline code.
+    Remove `code` spans from a line, as re.sub(r'`[^`]+`', '', line).
 
-    Returns list of .md file paths referenced in the content.
+    Pairs each backtick with the next one; an empty pair (``) is not a span,
+    so scanning resumes from its second backtick. validate_syntax uses this
+    too.
+    """
+    parts = []
+    pos = 0
+    while True:
+        start = line.find('`', pos)
+        if start < 0:
+            break
+        end = line.find('`', start + 1)
+        if end < 0:
+            break
+        if end == start + 1:
+            parts.append(line[pos:end])
+            pos = end
+            continue
+        parts.append(line[pos:start])
+        pos = end + 1
+    parts.append(line[pos:])
+    return ''.join(parts)
+
+
+def _find_md_refs(line: str) -> list[str]:
+    """
+    Find targets of [text](target.md) links in a single line.
+
+    For each '[', the first '](' after it whose target (up to the next ')')
+    ends in '.md' is taken; scanning then resumes after that ')'.
     """
-    lines = content.split('\n')
-    in_code_block = False
     refs = []
+    pos = 0
+    while True:
+        start = line.find('[', pos)
+        if start < 0:
+            return refs
+        close = line.find('](', start + 1)
+        while close >= 0:
+            end = line.find(')', close + 2)
+            if end < 0:
+                return refs
+            target = line[close + 2:end]
+            if len(target) > 3 and target.endswith('.md'):
+                refs.append(target)
+                pos = end + 1
+                break
+            close = line.find('](', close + 1)
+        else:
+            # No later '[' can see a link this one could not
+            return refs
 
-    for line in lines:
-        # Track code block state
-        if line.strip().startswith("```"):
-            in_code_block = not in_code_block
-            continue
 
-        # Skip lines inside code blocks
-        if in_code_block:
-            continue
+def iter_refs_outside_code_blocks(content: str,
+                                  parsed: Optional[ParsedContent] = None) -> Iterator[str]:
+    """
+    Yield markdown file references that are NOT inside fenced code blocks or inline code.
 
-        # Remove inline code (backticks) before searching for refs
-        # This prevents matching links inside `code` spans
-        line_without_inline_code = re.sub(r'`[^`]+`', '', line)
+    Refs are produced in document order as each line is scanned. parsed is
+    content's ParsedContent when the caller already has it.
+    """
+    if parsed is None:
+        parsed = parse_content(content)
+    lines = parsed.lines
+
+    # Scan only the lines between fenced code blocks
+    start = 0
+    for fence_open, fence_close in parsed.fence_spans + [(len(lines), len(lines))]:
+        for line in lines[start:fence_open]:
+            # Skip lines that cannot hold a link
+            if '[' not in line:
+                continue
 
-        # Find markdown file references in this line
-        line_refs = re.findall(r'\[.*?\]\(([^)]+\.md)\)', line_without_inline_code)
-        refs.extend(line_refs)
+            # Remove inline code (backticks) before searching for refs
+            # This prevents matching links inside `code` spans
+            if '`' in line:
+                line = _strip_inline_code(line)
 
-    return refs
+            yield from _find_md_refs(line)
+        start = fence_close + 1
 
 
-def validate_structure(skill_path: Path, content: str, report: ValidationReport):
-    """Validate skill structure (file organization, line counts)."""
-    lines = content.split('\n')
+def extract_refs_outside_code_blocks(content: str) -> list[str]:
+    """
+    Extract markdown file references that are NOT inside fenced code blocks or inline code.
+
+    Returns list of .md file paths referenced in the content.
+    """
+    return list(iter_refs_outside_code_blocks(content))
+
+
+def validate_structure(skill_path: Path, content: str, report: ValidationReport,
+                       text_cache: Optional[dict[Path, str]] = None,
+                       parsed: Optional[ParsedContent] = None):
+    """
+    Validate skill structure (file organization, line counts).
+
+    Reference files are taken from text_cache when present, and each one
+    is read and scanned at most once however often it is linked. parsed is
+    content's ParsedContent when the caller already has it.
+    """
+    if parsed is None:
+        parsed = parse_content(content)
+    lines = parsed.lines
 
     # Line count
     report.add(ValidationResult(
         "Structure: Line count",
         len(lines) <= 500,
-        f"SKILL.md is {len(lines)} lines (max 500)"
+        f"SKILL.md is {len(lines)} lines (max 500)",
+        category="line_count"
     ))
 
     # Validate TOC for long files (handles both existence and validity)
-    validate_toc(skill_path, content, report)
+    validate_toc(skill_path, content, report, parsed)
 
-    # Check for Windows paths
-    windows_paths = re.findall(r'[A-Za-z]:\\|\\\\', content)
+    # Check for Windows paths; both forms need a backslash, so skip the regex without one
+    windows_paths = '\\' in content and _WINDOWS_PATH_RE.search(content)
     report.add(ValidationResult(
         "Structure: Unix paths",
         not windows_paths,
-        "Use forward slashes, not backslashes for paths"
+        "Use forward slashes, not backslashes for paths",
+        category="path"
     ))
 
     # Check reference file depth (if this is SKILL.md)
     if skill_path.name == "SKILL.md":
         skill_dir = skill_path.parent
 
-        # Find all markdown file references (excluding those inside code blocks)
-        refs = extract_refs_outside_code_blocks(content)
+        # Follow markdown file references (excluding those inside code blocks)
         nested_refs = []
+        nested_by_path: dict[Path, list[str]] = {}
 
-        for ref in refs:
+        for ref in iter_refs_outside_code_blocks(content, parsed):
             ref_path = skill_dir / ref
-            if ref_path.exists():
-                ref_content = ref_path.read_text()
+            nested = nested_by_path.get(ref_path)
+            if nested is None:
+                ref_content = text_cache.get(ref_path) if text_cache else None
+                if ref_content is None:
+                    if not ref_path.exists():
+                        continue
+                    ref_content = read_skill_text(ref_path)
                 # Check if reference file has its own .md references (excluding code blocks)
-                nested = extract_refs_outside_code_blocks(ref_content)
-                if nested:
-                    nested_refs.append((ref, nested))
+                nested = nested_by_path[ref_path] = extract_refs_outside_code_blocks(ref_content)
+            if nested:
+                nested_refs.append((ref, nested))
 
         report.add(ValidationResult(
             "Structure: Reference depth",
             not nested_refs,
-            f"Reference files should not link to other .md files: {nested_refs}" if nested_refs else "References are one level deep"
+            f"Reference files should not link to other .md files: {nested_refs}" if nested_refs else "References are one level deep",
+            category="depth"
         ))
 
 
-def validate_references(skill_path: Path, content: str, report: ValidationReport):
-    """Validate that referenced markdown files exist and are at most one level deep."""
+def _list_dir(directory: Path) -> frozenset[str]:
+    """Names of existing entries in a directory (broken symlinks excluded); empty if unreadable."""
+    try:
+        with os.scandir(directory) as entries:
+            return frozenset(
+                e.name for e in entries
+                if not e.is_symlink() or os.path.exists(e.path)
+            )
+    except (OSError, ValueError):
+        return frozenset()
+
+
+def _ref_depth(ref: str) -> tuple[int, int]:
+    """
+    Count parent traversals (..) and forward directory components in a reference.
+
+    The filename and any '.' components are not counted. The common shapes
+    (DIR/FILE.md, ../FILE.md, ../DIR/FILE.md) are counted straight from the
+    string; anything with dots in its directory part falls back to a full split.
+    """
+    ref_normalized = ref.replace("\\", "/") if "\\" in ref else ref
+    dir_part = ref_normalized[:ref_normalized.rfind("/") + 1]
+
+    # Leading ../ components, then directory names without any dots
+    start = 0
+    while dir_part.startswith("../", start):
+        start += 3
+    if "." not in dir_part[start:] and ref_normalized[len(dir_part):] != "..":
+        return start // 3, dir_part.count("/", start)
+
+    parts = ref_normalized.split("/")
+    parent_count = sum(1 for p in parts if p == "..")
+    forward_count = sum(1 for p in parts[:-1] if p not in ("..", "."))
+    return parent_count, forward_count
+
+
+def validate_references(skill_path: Path, content: str, report: ValidationReport,
+                        parsed: Optional[ParsedContent] = None):
+    """
+    Validate that referenced markdown files exist and are at most one level deep.
+
+    parsed is content's ParsedContent when the caller already has it.
+    """
     if not skill_path.name.endswith(".md"):
         return
 
     skill_dir = skill_path.parent
 
-    # Find all markdown file references (excluding those in code blocks)
-    refs = extract_refs_outside_code_blocks(content)
+    # Directory listings by path, so refs sharing a directory cost one scandir
+    listings: dict[Path, frozenset[str]] = {}
+    # Existence by ref string, so a file linked many times is resolved once
+    found: dict[str, bool] = {}
 
-    for ref in refs:
+    # Check markdown file references as they are found (excluding those in code blocks)
+    for ref in iter_refs_outside_code_blocks(content, parsed):
         # Skip external URLs
         if ref.startswith("http://") or ref.startswith("https://"):
             continue
 
-        # Resolve the reference path relative to the skill file
-        ref_path = skill_dir / ref
+        exists = found.get(ref)
+        if exists is None:
+            # Resolve the reference path relative to the skill file
+            ref_path = skill_dir / ref
+            ref_dir = ref_path.parent
+            if ref_dir not in listings:
+                listings[ref_dir] = _list_dir(ref_dir)
+
+            # Misses are confirmed with a stat because the listing is
+            # case-sensitive even on case-insensitive filesystems
+            exists = ref_path.name in listings[ref_dir] or ref_path.exists()
+            found[ref] = exists
 
         # Check if file exists
-        if not ref_path.exists():
+        if not exists:
             report.add(ValidationResult(
                 "References: File exists",
                 False,
-                f"Referenced file not found: {ref}"
+                f"Referenced file not found: {ref}",
+                category="file_exists"
             ))
         else:
             report.add(ValidationResult(
                 "References: File exists",
                 True,
-                f"Referenced file exists: {ref}"
+                f"Referenced file exists: {ref}",
+                category="file_exists"
             ))
 
         # Check reference depth (should be at most one level deep from skill file)
-        # Normalize the path and count directory components
+        # Count parent traversals and forward directory components
         # Valid: "FILE.md", "subdir/FILE.md", "../FILE.md", "../sibling/FILE.md"
         # Invalid: "a/b/FILE.md", "../../FILE.md", "../a/b/FILE.md"
-        ref_normalized = ref.replace("\\", "/")
-        parts = ref_normalized.split("/")
-
-        # Count parent traversals (..)
-        parent_count = sum(1 for p in parts if p == "..")
-
-        # Count forward directory components (excluding .., ., and filename)
-        forward_dirs = [p for p in parts[:-1] if p not in ("..", ".")]
-        forward_count = len(forward_dirs)
+        parent_count, forward_count = _ref_depth(ref)
 
         # References should be at most one level in any direction
         # - One parent (..) plus one forward dir is OK (../sibling/FILE.md)
@@ -472,39 +824,50 @@ def validate_references(skill_path: Path, content: str, report: ValidationReport
             report.add(ValidationResult(
                 "References: Depth",
                 False,
-                f"Reference too deep (max one level): {ref}"
+                f"Reference too deep (max one level): {ref}",
+                category="depth"
             ))
 
 
+def _contains_emoji(content: str) -> bool:
+    """Check the distinct characters of content against the emoji table."""
+    first = _EMOJI_FIRST
+    limit = len(_EMOJI_TABLE)
+    for ch in set(content):
+        if ch < first:
+            continue
+        cp = ord(ch)
+        if cp < limit and _EMOJI_TABLE[cp]:
+            return True
+    return False
+
+
 def validate_no_emojis(content: str, report: ValidationReport):
     """Validate that skill files do not contain emojis."""
-    # Regex pattern for common emoji ranges
-    # This covers most Unicode emoji blocks
-    emoji_pattern = re.compile(
-        "["
-        "\U0001F600-\U0001F64F"  # Emoticons
-        "\U0001F300-\U0001F5FF"  # Misc Symbols and Pictographs
-        "\U0001F680-\U0001F6FF"  # Transport and Map
-        "\U0001F700-\U0001F77F"  # Alchemical Symbols
-        "\U0001F780-\U0001F7FF"  # Geometric Shapes Extended
-        "\U0001F800-\U0001F8FF"  # Supplemental Arrows-C
-        "\U0001F900-\U0001F9FF"  # Supplemental Symbols and Pictographs
-        "\U0001FA00-\U0001FA6F"  # Chess Symbols
-        "\U0001FA70-\U0001FAFF"  # Symbols and Pictographs Extended-A
-        "\U00002702-\U000027B0"  # Dingbats
-        "\U0001F1E0-\U0001F1FF"  # Flags (iOS)
-        "]+",
-        flags=re.UNICODE
-    )
+    # Every emoji is outside ASCII, so pure-ASCII content needs no scan;
+    # otherwise a table lookup per distinct character rules emojis out
+    # before the per-line regex scan that locates them
+    if content.isascii() or not _contains_emoji(content):
+        report.add(ValidationResult(
+            "Content: No emojis",
+            True,
+            "No emojis found",
+            category="emoji"
+        ))
+        return
 
-    lines = content.split('\n')
+    # Scan the whole text at once and map each match back to its line;
+    # a run of emojis never spans a newline, so runs match the per-line ones.
+    # Line numbers come from counting newlines between consecutive matches,
+    # so no per-line offset table is built
     emojis_found = []
-
-    for i, line in enumerate(lines, start=1):
-        matches = emoji_pattern.findall(line)
-        if matches:
-            for match in matches:
-                emojis_found.append((i, match))
+    line_number = 1
+    pos = 0
+    for m in _EMOJI_RE.finditer(content):
+        start = m.start()
+        line_number += content.count('\n', pos, start)
+        pos = start
+        emojis_found.append((line_number, m.group()))
 
     if emojis_found:
         # Report first few emojis found
@@ -513,16 +876,77 @@ def validate_no_emojis(content: str, report: ValidationReport):
         report.add(ValidationResult(
             "Content: No emojis",
             False,
-            f"Emojis found: {emoji_list}{suffix}"
+            f"Emojis found: {emoji_list}{suffix}",
+            category="emoji"
         ))
     else:
         report.add(ValidationResult(
             "Content: No emojis",
             True,
-            "No emojis found"
+            "No emojis found",
+            category="emoji"
         ))
 
 
+def validate_no_null_bytes(content: str, report: ValidationReport):
+    """Validate that skill files do not contain NUL characters."""
+    first = content.find('\x00')
+    if first < 0:
+        report.add(ValidationResult(
+            "Content: No null bytes",
+            True,
+            "No null bytes found",
+            severity="warning",
+            category="null_bytes"
+        ))
+        return
+
+    line = content.count('\n', 0, first) + 1
+    report.add(ValidationResult(
+        "Content: No null bytes",
+        False,
+        f"Null byte found (line {line}); the file may be binary or corrupted",
+        severity="warning",
+        category="null_bytes"
+    ))
+
+
+def _walk_files(directory: str, rel_prefix: str, in_scripts: bool,
+                ignored_dirs: frozenset[str]) -> Iterator[tuple[str, str, bool]]:
+    """
+    Yield (relative path, name, under scripts/) for the files below directory.
+
+    Matches Path.rglob("*") minus directories: a directory's files come
+    before its subdirectories' files, symlinked directories are neither
+    entered nor yielded, and unreadable directories are skipped. Entries
+    named in ignored_dirs are pruned along with everything beneath them.
+    """
+    try:
+        with os.scandir(directory) as it:
+            entries = list(it)
+    except OSError:
+        return
+
+    subdirs = []
+    for entry in entries:
+        name = entry.name
+        if name in ignored_dirs:
+            continue
+        try:
+            is_dir = entry.is_dir()
+            is_real_dir = is_dir and not entry.is_symlink()
+        except OSError:
+            is_dir = is_real_dir = False
+        if is_real_dir:
+            subdirs.append(entry)
+        elif not is_dir:
+            yield rel_prefix + name, name, in_scripts
+
+    for entry in subdirs:
+        yield from _walk_files(entry.path, rel_prefix + entry.name + os.sep,
+                               in_scripts or entry.name == "scripts", ignored_dirs)
+
+
 def validate_file_types(skill_path: Path, report: ValidationReport):
     """Validate that skill directory contains only allowed file types."""
     # Only validate if we have a directory context
@@ -536,76 +960,29 @@ def validate_file_types(skill_path: Path, report: ValidationReport):
 
     skill_dir = skill_path.parent if skill_path.is_file() else skill_path
 
-    # Allowed markdown extensions (anywhere in skill directory)
-    markdown_extensions = {".md", ".markdown"}
-
-    # Allowed script/code extensions (only in scripts/ directory)
-    script_extensions = {
-        # Python
-        ".py", ".pyi", ".pyw",
-        # JavaScript/TypeScript
-        ".js", ".ts", ".mjs", ".cjs", ".jsx", ".tsx",
-        # Shell
-        ".sh", ".bash", ".zsh", ".fish",
-        # Other languages
-        ".rb", ".go", ".rs", ".pl", ".php", ".lua", ".r", ".R",
-        # Config files
-        ".yaml", ".yml", ".json", ".toml", ".ini", ".cfg", ".conf",
-        # Data files that scripts might use
-        ".csv", ".txt",
-    }
-
-    # Directories to ignore entirely
-    ignored_dirs = {
-        "__pycache__", ".git", ".svn", ".hg",
-        "node_modules", ".venv", "venv", ".env",
-        ".pytest_cache", ".mypy_cache", ".ruff_cache",
-        "dist", "build", ".tox", ".eggs",
-    }
-
-    # Files to ignore
-    ignored_files = {
-        ".gitignore", ".gitattributes", ".editorconfig",
-        ".DS_Store", "Thumbs.db",
-        "__init__.py",  # Allow __init__.py in scripts
-    }
-
     invalid_files = []
 
-    # Walk the skill directory
-    for item in skill_dir.rglob("*"):
-        # Skip directories
-        if item.is_dir():
-            continue
-
-        # Get path relative to skill directory
-        try:
-            rel_path = item.relative_to(skill_dir)
-        except ValueError:
-            continue
-
-        # Skip ignored directories
-        if any(ignored_dir in rel_path.parts for ignored_dir in ignored_dirs):
-            continue
-
+    # Walk the skill directory (ignored directories are never entered)
+    for rel_path, name, in_scripts in _walk_files(str(skill_dir), "", False, _IGNORED_DIRS):
         # Skip ignored files
-        if item.name in ignored_files:
+        if name in _IGNORED_FILES:
             continue
 
-        # Check file extension
-        ext = item.suffix.lower()
+        # Check file extension (same rule as Path.suffix)
+        dot = name.rfind(".")
+        ext = name[dot:].lower() if 0 < dot < len(name) - 1 else ""
 
         # Markdown files allowed anywhere
-        if ext in markdown_extensions:
+        if ext in _MARKDOWN_EXTENSIONS:
             continue
 
         # Script/config files only allowed in scripts/ directory
-        if "scripts" in rel_path.parts:
-            if ext in script_extensions:
+        if in_scripts:
+            if ext in _SCRIPT_EXTENSIONS:
                 continue
 
         # If we get here, the file is not allowed
-        invalid_files.append(str(rel_path))
+        invalid_files.append(rel_path)
 
     if invalid_files:
         # Report first few invalid files
@@ -614,58 +991,82 @@ def validate_file_types(skill_path: Path, report: ValidationReport):
         report.add(ValidationResult(
             "Structure: File types",
             False,
-            f"Unexpected files found: {file_list}{suffix}"
+            f"Unexpected files found: {file_list}{suffix}",
+            category="file_types"
         ))
     else:
         report.add(ValidationResult(
             "Structure: File types",
             True,
-            "All files have allowed types"
+            "All files have allowed types",
+            category="file_types"
         ))
 
 
 def validate_content(skill_path: Path, content: str, report: ValidationReport):
     """Validate content patterns (checklists, etc.)."""
     # Check for copyable checklists
-    has_checklist = bool(re.search(r'- \[ \]', content))
+    has_checklist = '- [ ]' in content
 
-    # Only warn if file seems to describe a workflow
-    has_workflow_words = any(word in content.lower() for word in ['workflow', 'step', 'process', 'phase'])
+    # Only warn if file seems to describe a workflow (lowercase the text once, not per word)
+    content_lower = content.lower()
+    has_workflow_words = any(word in content_lower for word in ('workflow', 'step', 'process', 'phase'))
     if has_workflow_words:
         report.add(ValidationResult(
             "Content: Copyable checklists",
             has_checklist,
             "Workflows should include copyable checklists (- [ ])",
-            severity="warning"
+            severity="warning",
+            category="checklist"
         ))
 
-    # Check for concrete examples (inline or via reference file)
-    has_inline_examples = bool(re.search(r'##.*example|example:', content, re.IGNORECASE))
-    has_example_ref = bool(re.search(r'\[.*?\]\([^)]*example[^)]*\.md\)', content, re.IGNORECASE))
-    has_examples = has_inline_examples or has_example_ref
+    # Check for concrete examples (inline or via reference file);
+    # the reference scan only runs when there is no inline example
+    has_examples = bool(_INLINE_EXAMPLE_RE.search(content) or _EXAMPLE_REF_RE.search(content))
     report.add(ValidationResult(
         "Content: Has examples",
         has_examples,
         "Skill should include concrete examples (inline or via reference file)",
-        severity="warning"
+        severity="warning",
+        category="examples"
     ))
 
     # Check for pip/npm install commands near imports (only for non-Markdown files)
     if not skill_path.suffix.lower() in ('.md', '.markdown'):
-        imports = re.findall(r'(?:import|from|require)\s+(\w+)', content)
-        has_install_guidance = bool(re.search(r'pip install|npm install|yarn add', content))
-
-        if imports:
+        # The first import is enough; install hints are only looked for then
+        if _IMPORT_RE.search(content):
             report.add(ValidationResult(
                 "Content: Dependency install guidance",
-                has_install_guidance,
+                bool(_INSTALL_RE.search(content)),
                 "Include install commands for dependencies",
-                severity="warning"
+                severity="warning",
+                category="install"
             ))
 
 
-def validate_skill(skill_path: Path) -> ValidationReport:
-    """Run all validations on a skill."""
+def read_skill_text(path: Path) -> str:
+    """
+    Read a skill file as UTF-8 text.
+
+    A leading byte order mark is dropped so it cannot hide the opening
+    frontmatter delimiter. Line endings are normalized to '\n', as
+    read_text() does.
+    """
+    text = path.read_bytes().removeprefix(_UTF8_BOM).decode('utf-8')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+def validate_skill(skill_path: Path,
+                   text_cache: Optional[dict[Path, str]] = None) -> ValidationReport:
+    """
+    Run all validations on a skill.
+
+    text_cache maps paths to text already read by the caller; SKILL.md and
+    the files it references are taken from it when present instead of
+    being read again.
+    """
     # Handle directory vs file path
     if skill_path.is_dir():
         skill_file = skill_path / "SKILL.md"
@@ -674,11 +1075,14 @@ def validate_skill(skill_path: Path) -> ValidationReport:
             sys.exit(1)
         skill_path = skill_file
 
-    if not skill_path.exists():
-        print(f"Error: File not found: {skill_path}")
-        sys.exit(1)
-
-    content = skill_path.read_text()
+    content = text_cache.get(skill_path) if text_cache else None
+    if content is None:
+        if not skill_path.exists():
+            print(f"Error: File not found: {skill_path}")
+            sys.exit(1)
+        content = read_skill_text(skill_path)
+    # Split once up front and share the line view with the validators below
+    parsed = parse_content(content)
 
     # Extract name from frontmatter for report
     frontmatter = parse_frontmatter(content)
@@ -688,10 +1092,11 @@ def validate_skill(skill_path: Path) -> ValidationReport:
 
     # Run all validations
     validate_metadata(content, report)
-    validate_structure(skill_path, content, report)
+    validate_structure(skill_path, content, report, text_cache, parsed)
     validate_file_types(skill_path, report)
-    validate_references(skill_path, content, report)
+    validate_references(skill_path, content, report, parsed)
     validate_no_emojis(content, report)
+    validate_no_null_bytes(content, report)
     validate_content(skill_path, content, report)
 
     return report
@@ -17,16 +17,42 @@ Usage:
     python validate_syntax.py <skill_path>
     python validate_syntax.py ./my-skill/SKILL.md
     python validate_syntax.py ./my-skill/  # Validates all .md files
+    python validate_syntax.py ./my-skill/ --fail-fast  # Stop at the first file with errors
 """
 
+import os
 import re
 import sys
+from itertools import islice
 from pathlib import Path
-from dataclasses import dataclass, field
-from typing import Optional
-
-
-@dataclass
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from typing import Iterator, Optional
+
+from validate_skill import _strip_inline_code, read_skill_text
+
+
+_HASH_LINE_RE = re.compile(r'^#', re.MULTILINE)
+_ASCII_LETTERS = frozenset('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ')
+_LIST_MARKERS = frozenset('-*+')
+_UNORDERED_ITEM_RE = re.compile(r'^(\s*)([-*+])\s')
+_ORDERED_ITEM_RE = re.compile(r'^(\s*)(\d+)\.\s')
+_MARKER_NO_SPACE_RE = re.compile(r'^[-*+]\S')
+_HORIZONTAL_RULE_RE = re.compile(r'^[-*_]{3,}\s*$')
+_EMPHASIS_START_RE = re.compile(r'^[*]{1,2}\w')
+# A whitespace-only table cell, matched up to (not including) its closing pipe
+_BLANK_CELL_RE = re.compile(r'\|\s+(?=\|)')
+_H1_RE = re.compile(r'^# ', re.MULTILINE)
+# Below this many bytes of markdown validate_directory runs in-process.
+# Measured on SKILL.md-sized files: validation takes about 30 us per KB,
+# while starting a two-worker pool costs about 6 ms and passing files and
+# reports to it about 7 us per KB, so two workers only win past ~1 MB.
+_MIN_PARALLEL_BYTES = 1 << 20
+# Most files whose reports validate_directory keeps between calls
+_REPORT_CACHE_SIZE = 2048
+
+
+@dataclass(slots=True)
 class SyntaxIssue:
     """A single syntax issue found during validation."""
     line_number: int
@@ -36,26 +62,55 @@ class SyntaxIssue:
     context: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SyntaxReport:
     """Complete syntax validation report."""
     file_path: Path
     issues: list[SyntaxIssue] = field(default_factory=list)
+    # Issues bucketed by severity as they are added
+    _errors: list[SyntaxIssue] = field(default_factory=list, init=False, repr=False)
+    _warnings: list[SyntaxIssue] = field(default_factory=list, init=False, repr=False)
+    # ...and by category, so summaries never rescan the issue list
+    _by_category: dict[str, list[SyntaxIssue]] = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self):
+        # Index issues passed in at construction the same way add() does
+        issues, self.issues = self.issues, []
+        for issue in issues:
+            self.add(issue)
+
+    def copy(self) -> "SyntaxReport":
+        """Return a report with copies of this one's issues."""
+        return SyntaxReport(self.file_path, [replace(issue) for issue in self.issues])
 
     def add(self, issue: SyntaxIssue):
         self.issues.append(issue)
+        if issue.severity == "error":
+            self._errors.append(issue)
+        elif issue.severity == "warning":
+            self._warnings.append(issue)
+        bucket = self._by_category.get(issue.category)
+        if bucket is None:
+            self._by_category[issue.category] = [issue]
+        else:
+            bucket.append(issue)
 
     @property
     def passed(self) -> bool:
-        return not any(i.severity == "error" for i in self.issues)
+        return not self._errors
 
     @property
     def errors(self) -> list[SyntaxIssue]:
-        return [i for i in self.issues if i.severity == "error"]
+        return self._errors
 
     @property
     def warnings(self) -> list[SyntaxIssue]:
-        return [i for i in self.issues if i.severity == "warning"]
+        return self._warnings
+
+    @property
+    def category_counts(self) -> dict[str, int]:
+        """Number of issues in each category."""
+        return {cat: len(issues) for cat, issues in self._by_category.items()}
 
     def print_report(self):
         status = "PASS" if self.passed else "FAIL"
@@ -68,14 +123,7 @@ class SyntaxReport:
         if not self.issues:
             print("No syntax issues found.")
         else:
-            # Group by category
-            categories = {}
-            for issue in self.issues:
-                if issue.category not in categories:
-                    categories[issue.category] = []
-                categories[issue.category].append(issue)
-
-            for cat, issues in sorted(categories.items()):
+            for cat, issues in sorted(self._by_category.items()):
                 print(f"\n{cat}")
                 print("-" * len(cat))
                 for issue in issues:
@@ -94,6 +142,48 @@ class SyntaxReport:
         print(f"VERDICT: {status}")
 
 
+# validate_directory reports by path, with the (mtime_ns, size) they were
+# made from; insertion order tracks how recently each was validated
+_report_cache: dict[Path, tuple[tuple[int, int], SyntaxReport]] = {}
+
+
+def clear_report_cache():
+    """Forget the reports validate_directory kept from earlier calls."""
+    _report_cache.clear()
+
+
+@dataclass(slots=True)
+class LineScan:
+    """Lines of a file classified once, shared by the per-line validators."""
+    # (line_number, line) for every line outside fenced code blocks,
+    # excluding the ``` delimiter lines themselves
+    prose: list[tuple[int, str]]
+    # Line number of an unclosed opening ``` delimiter, or 0 if all are closed
+    unclosed_fence: int = 0
+
+
+def scan_lines(lines: list[str]) -> LineScan:
+    """Split lines into prose and fenced code in a single pass."""
+    # Most files have no fences at all; one C-level substring check over the
+    # joined text then settles it without the per-line loop
+    if '```' not in '\n'.join(lines):
+        return LineScan(prose=list(enumerate(lines, start=1)))
+
+    prose = []
+    in_code_block = False
+    fence_start = 0
+
+    for i, line in enumerate(lines, start=1):
+        if line.lstrip().startswith("```"):
+            in_code_block = not in_code_block
+            fence_start = i if in_code_block else 0
+            continue
+        if not in_code_block:
+            prose.append((i, line))
+
+    return LineScan(prose=prose, unclosed_fence=fence_start)
+
+
 def validate_frontmatter_syntax(content: str, lines: list[str], report: SyntaxReport, is_skill_file: bool = True):
     """Validate YAML frontmatter syntax and structure."""
     # Check for frontmatter presence
@@ -108,10 +198,10 @@ def validate_frontmatter_syntax(content: str, lines: list[str], report: SyntaxRe
             ))
         return
 
-    # Find closing delimiter
-    lines_text = content.split('\n')
+    # Find closing delimiter; only the header block is scanned, and the
+    # caller's lines are reused rather than splitting content again
     closing_line = None
-    for i, line in enumerate(lines_text[1:], start=2):
+    for i, line in enumerate(islice(lines, 1, None), start=2):
         if line.strip() == "---":
             closing_line = i
             break
@@ -126,7 +216,7 @@ def validate_frontmatter_syntax(content: str, lines: list[str], report: SyntaxRe
         return
 
     # Extract frontmatter content
-    frontmatter_lines = lines_text[1:closing_line-1]
+    frontmatter_lines = lines[1:closing_line-1]
 
     # Check for required fields
     has_name = False
@@ -182,21 +272,31 @@ def validate_frontmatter_syntax(content: str, lines: list[str], report: SyntaxRe
         ))
 
 
-def validate_heading_hierarchy(lines: list[str], report: SyntaxReport):
-    """Validate heading hierarchy (no skipping levels)."""
-    current_level = 0
-    in_code_block = False
-    in_agent_prompt = False
-
-    for i, line in enumerate(lines, start=1):
-        # Track code blocks to skip headings inside them
-        if line.strip().startswith("```"):
-            in_code_block = not in_code_block
-            continue
-
-        if in_code_block:
-            continue
+def _heading_candidates(lines: list[str], scan: LineScan):
+    """
+    Yield (line_number, line) for lines starting with '#' that are outside
+    code blocks and agent prompts.
+    """
+    text = '\n'.join(lines)
+
+    if ('<agent-prompt' not in text and '</agent-prompt>' not in text
+            and text.count('\n') == len(lines) - 1):
+        # No agent prompts to track (and no newlines embedded in a line), so
+        # let the regex engine find the '#' line starts instead of visiting
+        # every line
+        in_prose = None if len(scan.prose) == len(lines) else {i for i, _ in scan.prose}
+        line_number = 1
+        pos = 0
+        for match in _HASH_LINE_RE.finditer(text):
+            start = match.start()
+            line_number += text.count('\n', pos, start)
+            pos = start
+            if in_prose is None or line_number in in_prose:
+                yield line_number, lines[line_number - 1]
+        return
 
+    in_agent_prompt = False
+    for i, line in scan.prose:
         # Track agent-prompt tags (subagent prompts have their own heading structure)
         if '<agent-prompt' in line:
             in_agent_prompt = True
@@ -205,68 +305,52 @@ def validate_heading_hierarchy(lines: list[str], report: SyntaxReport):
             in_agent_prompt = False
             continue
 
-        if in_agent_prompt:
-            continue
+        if not in_agent_prompt and line.startswith('#'):
+            yield i, line
 
-        # Match heading lines
-        match = re.match(r'^(#{1,6})\s+', line)
-        if match:
-            level = len(match.group(1))
 
-            # First heading can be any level
-            if current_level == 0:
-                current_level = level
-                continue
+def validate_heading_hierarchy(lines: list[str], report: SyntaxReport,
+                               scan: Optional[LineScan] = None):
+    """Validate heading hierarchy (no skipping levels)."""
+    if scan is None:
+        scan = scan_lines(lines)
+    current_level = 0
 
-            # Check for skipped levels (e.g., ## to ####)
-            if level > current_level + 1:
-                report.add(SyntaxIssue(
-                    line_number=i,
-                    category="Headings",
-                    severity="warning",
-                    message=f"Heading level skipped: jumped from H{current_level} to H{level}",
-                    context=line.strip()
-                ))
+    # Headings inside code blocks and agent prompts are skipped
+    for i, line in _heading_candidates(lines, scan):
+        # A heading is a run of 1-6 '#' followed by whitespace; measuring
+        # the run with lstrip avoids a regex match per candidate
+        level = len(line) - len(line.lstrip('#'))
+        if not 0 < level <= 6 or not line[level:level + 1].isspace():
+            continue
 
+        # First heading can be any level
+        if current_level == 0:
             current_level = level
+            continue
 
-            # Check for missing space after #
-            if re.match(r'^#+[^#\s]', line):
-                report.add(SyntaxIssue(
-                    line_number=i,
-                    category="Headings",
-                    severity="error",
-                    message="Heading missing space after # characters",
-                    context=line.strip()
-                ))
+        # Check for skipped levels (e.g., ## to ####)
+        if level > current_level + 1:
+            report.add(SyntaxIssue(
+                line_number=i,
+                category="Headings",
+                severity="warning",
+                message=f"Heading level skipped: jumped from H{current_level} to H{level}",
+                context=line.strip()
+            ))
 
+        current_level = level
 
-def validate_code_blocks(lines: list[str], report: SyntaxReport):
-    """Validate code block delimiters are properly matched."""
-    in_code_block = False
-    code_block_start = 0
-    code_block_lang = None
 
-    for i, line in enumerate(lines, start=1):
-        stripped = line.strip()
-
-        # Check for code block delimiter
-        if stripped.startswith("```"):
-            if not in_code_block:
-                # Opening delimiter
-                in_code_block = True
-                code_block_start = i
-                # Extract language specifier
-                lang = stripped[3:].strip()
-                code_block_lang = lang if lang else None
-            else:
-                # Closing delimiter
-                in_code_block = False
-                code_block_start = 0
-                code_block_lang = None
+def validate_code_blocks(lines: list[str], report: SyntaxReport,
+                         scan: Optional[LineScan] = None):
+    """Validate code block delimiters are properly matched."""
+    if scan is None:
+        scan = scan_lines(lines)
+    code_block_start = scan.unclosed_fence
 
     # Check for unclosed code block
-    if in_code_block:
+    if code_block_start:
         report.add(SyntaxIssue(
             line_number=code_block_start,
             category="Code Blocks",
@@ -276,33 +360,113 @@ def validate_code_blocks(lines: list[str], report: SyntaxReport):
         ))
 
 
-def validate_links(lines: list[str], report: SyntaxReport):
-    """Validate Markdown link syntax."""
-    # Pattern for markdown links: [text](url)
-    link_pattern = re.compile(r'\[([^\]]*)\]\(([^)]*)\)')
-    # Pattern for broken links (missing parts)
-    # These patterns look for markdown link syntax, not JSON arrays
-    broken_link_patterns = [
-        (re.compile(r'\[[^\]]*\]\([^)]*$'), "Link URL not closed with )"),
-        # Look for [text at line end, but NOT preceded by : or = (JSON/code patterns)
-        (re.compile(r'(?<![:\s=])\[[a-zA-Z][^\]]*$'), "Link text not closed with ]"),
-        (re.compile(r'(?<!\])\([^)]+\.md\)'), "Link URL without link text"),
-    ]
-
-    in_code_block = False
-    for i, line in enumerate(lines, start=1):
-        # Track code block state
-        if line.strip().startswith("```"):
-            in_code_block = not in_code_block
+# The link scanners below walk a line with str.find instead of regexes: the
+# equivalent patterns rescan the rest of the line from every '[' or '(' that
+# fails to match, which is quadratic on lines full of brackets.
+
+def _iter_links(line: str) -> Iterator[tuple[str, str, str]]:
+    r"""
+    Yield (text, url, whole) for each [text](url) link, left to right.
+
+    Matches what re.finditer(r'\[([^\]]*)\]\(([^)]*)\)') finds.
+    """
+    pos = 0
+    while True:
+        start = line.find('[', pos)
+        if start < 0:
+            return
+        close = line.find(']', start + 1)
+        if close < 0:
+            return
+        # Every '[' before this ']' shares it, so they all succeed or fail together
+        if not line.startswith('(', close + 1):
+            pos = close + 1
             continue
+        end = line.find(')', close + 2)
+        if end < 0:
+            # No later link can find a ')' either
+            return
+        yield line[start + 1:close], line[close + 2:end], line[start:end + 1]
+        pos = end + 1
+
+
+def _url_not_closed(line: str) -> bool:
+    r"""A [text]( link with no ')' after it, as r'\[[^\]]*\]\([^)]*$'."""
+    # The '(' must come after the last ')' in the line
+    pos = max(line.rfind(')'), 0)
+    while True:
+        close = line.find('](', pos)
+        if close < 0:
+            return False
+        # The nearest bracket before "](" must be an opening one
+        if line.rfind('[', 0, close) > line.rfind(']', 0, close):
+            return True
+        pos = close + 1
+
+
+def _text_not_closed(line: str) -> bool:
+    r"""
+    A '[' plus letter with no ']' after it, not preceded by ':', '=' or
+    whitespace, as r'(?<![:\s=])\[[a-zA-Z][^\]]*$'.
+    """
+    pos = line.rfind(']') + 1
+    while True:
+        start = line.find('[', pos)
+        if start < 0:
+            return False
+        if start + 1 < len(line) and line[start + 1] in _ASCII_LETTERS:
+            if start == 0:
+                return True
+            before = line[start - 1]
+            if before not in ':=' and not before.isspace():
+                return True
+        pos = start + 1
+
+
+def _url_without_text(line: str) -> bool:
+    r"""A '(' not preceded by ']' that closes as '.md)', as r'(?<!\])\([^)]+\.md\)'."""
+    pos = 0
+    while True:
+        md = line.find('.md)', pos)
+        if md < 0:
+            return False
+        end = md + 3
+        # The '(' must come after the previous ')' and leave at least one
+        # character before ".md"
+        lo = line.rfind(')', 0, end) + 1
+        hi = md - 1
+        start = line.find('(', lo, hi) if hi > lo else -1
+        while start >= 0:
+            if start == 0 or line[start - 1] != ']':
+                return True
+            start = line.find('(', start + 1, hi)
+        pos = end + 1
+
+
+# Checks for broken links (missing parts).
+# These look for markdown link syntax, not JSON arrays.
+_BROKEN_LINK_CHECKS = (
+    (_url_not_closed, "Link URL not closed with )"),
+    # [text at line end, but NOT preceded by : or = (JSON/code patterns)
+    (_text_not_closed, "Link text not closed with ]"),
+    (_url_without_text, "Link URL without link text"),
+)
+
+
+def validate_links(lines: list[str], report: SyntaxReport,
+                   scan: Optional[LineScan] = None):
+    """Validate Markdown link syntax."""
+    if scan is None:
+        scan = scan_lines(lines)
 
-        # Skip lines inside code blocks
-        if in_code_block:
+    for i, line in scan.prose:
+        # Every link pattern needs a [ or a (
+        if '[' not in line and '(' not in line:
             continue
 
         # Check for common link syntax errors
-        for pattern, message in broken_link_patterns:
-            if pattern.search(line):
+        for check, message in _BROKEN_LINK_CHECKS:
+            if check(line):
                 report.add(SyntaxIssue(
                     line_number=i,
                     category="Links",
@@ -312,8 +476,7 @@ def validate_links(lines: list[str], report: SyntaxReport):
                 ))
 
         # Validate found links
-        for match in link_pattern.finditer(line):
-            text, url = match.groups()
+        for text, url, link in _iter_links(line):
 
             # Check for empty link text
             if not text.strip():
@@ -322,7 +485,7 @@ def validate_links(lines: list[str], report: SyntaxReport):
                     category="Links",
                     severity="warning",
                     message="Link has empty text",
-                    context=match.group(0)
+                    context=link
                 ))
 
             # Check for empty URL
@@ -332,7 +495,7 @@ def validate_links(lines: list[str], report: SyntaxReport):
                     category="Links",
                     severity="error",
                     message="Link has empty URL",
-                    context=match.group(0)
+                    context=link
                 ))
 
             # Check for spaces in URL (should be encoded)
@@ -342,92 +505,103 @@ def validate_links(lines: list[str], report: SyntaxReport):
                     category="Links",
                     severity="warning",
                     message="Link URL contains spaces (should be URL-encoded)",
-                    context=match.group(0)
+                    context=link
                 ))
 
 
-def validate_lists(lines: list[str], report: SyntaxReport):
-    """Validate list formatting consistency."""
-    in_code_block = False
+@lru_cache(maxsize=4096)
+def _list_item_issues(line: str) -> tuple[tuple[str, str, str], ...]:
+    """
+    Return (severity, message, context) for each list problem on a line.
 
-    for i, line in enumerate(lines, start=1):
-        # Track code blocks to skip them
-        if line.strip().startswith("```"):
-            in_code_block = not in_code_block
-            continue
+    Depends only on the line, so boilerplate items repeated across a file
+    or a directory of skills are checked once.
+    """
+    issues = []
 
-        if in_code_block:
-            continue
-
-        # Check for unordered list items
-        unordered_match = re.match(r'^(\s*)([-*+])\s', line)
-        if unordered_match:
-            indent, marker = unordered_match.groups()
-
-            # Check for inconsistent indentation (not multiple of 2)
-            if len(indent) % 2 != 0 and len(indent) > 0:
-                report.add(SyntaxIssue(
-                    line_number=i,
-                    category="Lists",
-                    severity="warning",
-                    message=f"List indentation is {len(indent)} spaces (recommend multiples of 2)",
-                    context=line.rstrip()
-                ))
+    # Check for unordered list items
+    unordered_match = _UNORDERED_ITEM_RE.match(line)
+    if unordered_match:
+        indent, marker = unordered_match.groups()
 
-        # Check for ordered list items
-        ordered_match = re.match(r'^(\s*)(\d+)\.\s', line)
-        if ordered_match:
-            indent, num = ordered_match.groups()
+        # Check for inconsistent indentation (not multiple of 2)
+        if len(indent) % 2 != 0 and len(indent) > 0:
+            issues.append((
+                "warning",
+                f"List indentation is {len(indent)} spaces (recommend multiples of 2)",
+                line.rstrip(),
+            ))
 
-            # Check for inconsistent indentation
-            if len(indent) % 2 != 0 and len(indent) > 0:
-                report.add(SyntaxIssue(
-                    line_number=i,
-                    category="Lists",
-                    severity="warning",
-                    message=f"List indentation is {len(indent)} spaces (recommend multiples of 2)",
-                    context=line.rstrip()
-                ))
+    # Check for ordered list items
+    ordered_match = _ORDERED_ITEM_RE.match(line)
+    if ordered_match:
+        indent, num = ordered_match.groups()
+
+        # Check for inconsistent indentation
+        if len(indent) % 2 != 0 and len(indent) > 0:
+            issues.append((
+                "warning",
+                f"List indentation is {len(indent)} spaces (recommend multiples of 2)",
+                line.rstrip(),
+            ))
 
-        # Check for list item without space after marker
-        # Exclude: horizontal rules (---, ***, ___), emphasis (**text, *text)
-        stripped = line.strip()
-        if re.match(r'^[-*+]\S', stripped):
+    # Check for list item without space after marker
+    # Exclude: horizontal rules (---, ***, ___), emphasis (**text, *text)
+    stripped = line.strip()
+    if (_MARKER_NO_SPACE_RE.match(stripped)
             # Skip horizontal rules (3+ of same character)
-            if re.match(r'^[-*_]{3,}\s*$', stripped):
-                continue
+            and not _HORIZONTAL_RULE_RE.match(stripped)
             # Skip emphasis markers (** or * followed by word character)
-            if re.match(r'^[*]{1,2}\w', stripped):
-                continue
+            and not _EMPHASIS_START_RE.match(stripped)):
+        issues.append(("error", "List item missing space after marker", stripped))
+
+    return tuple(issues)
+
+
+def validate_lists(lines: list[str], report: SyntaxReport,
+                   scan: Optional[LineScan] = None):
+    """Validate list formatting consistency."""
+    if scan is None:
+        scan = scan_lines(lines)
+
+    for i, line in scan.prose:
+        # Every list pattern starts with a marker or digit after the indent
+        head = line.lstrip()[:1]
+        if not (head in _LIST_MARKERS or head.isdigit()):
+            continue
+
+        for severity, message, context in _list_item_issues(line):
             report.add(SyntaxIssue(
                 line_number=i,
                 category="Lists",
-                severity="error",
-                message="List item missing space after marker",
-                context=line.strip()
+                severity=severity,
+                message=message,
+                context=context
             ))
 
 
-def validate_tables(lines: list[str], report: SyntaxReport):
+def validate_tables(lines: list[str], report: SyntaxReport,
+                    scan: Optional[LineScan] = None):
     """Validate Markdown table syntax."""
-    in_code_block = False
+    if scan is None:
+        scan = scan_lines(lines)
     table_start = None
     header_cols = 0
 
-    for i, line in enumerate(lines, start=1):
-        # Track code blocks
-        if line.strip().startswith("```"):
-            in_code_block = not in_code_block
-            continue
-
-        if in_code_block:
+    for i, line in scan.prose:
+        # A line without a pipe cannot be a row, but still ends an open table
+        if '|' not in line:
+            if table_start is not None:
+                table_start = None
+                header_cols = 0
             continue
-
         stripped = line.strip()
 
         # Detect table rows (lines starting and ending with |)
         if stripped.startswith("|") and stripped.endswith("|"):
-            cols = len([c for c in stripped.split("|") if c.strip() or c == ""])
+            # Every pipe-separated cell counts except whitespace-only ones;
+            # the row starts and ends with a pipe, so the end cells are empty
+            cols = stripped.count("|") + 1 - len(_BLANK_CELL_RE.findall(stripped))
 
             if table_start is None:
                 # First row (header)
@@ -449,23 +623,23 @@ def validate_tables(lines: list[str], report: SyntaxReport):
             header_cols = 0
 
 
-def validate_emphasis(lines: list[str], report: SyntaxReport):
+def validate_emphasis(lines: list[str], report: SyntaxReport,
+                      scan: Optional[LineScan] = None):
     """Validate emphasis markers (*, **, _, __)."""
-    in_code_block = False
-
-    for i, line in enumerate(lines, start=1):
-        if line.strip().startswith("```"):
-            in_code_block = not in_code_block
-            continue
-
-        if in_code_block:
+    if scan is None:
+        scan = scan_lines(lines)
+
+    for i, line in scan.prose:
+        # Skip inline code; without backticks or doubled markers there is nothing to count
+        if '`' in line:
+            line_no_code = _strip_inline_code(line)
+        elif '**' in line or '__' in line:
+            line_no_code = line
+        else:
             continue
 
-        # Skip inline code
-        line_no_code = re.sub(r'`[^`]+`', '', line)
-
         # Check for unmatched bold markers (**)
-        bold_count = len(re.findall(r'\*\*', line_no_code))
+        bold_count = line_no_code.count('**')
         if bold_count % 2 != 0:
             report.add(SyntaxIssue(
                 line_number=i,
@@ -476,7 +650,7 @@ def validate_emphasis(lines: list[str], report: SyntaxReport):
             ))
 
         # Check for unmatched underscore bold markers (__)
-        underscore_bold_count = len(re.findall(r'__', line_no_code))
+        underscore_bold_count = line_no_code.count('__')
         if underscore_bold_count % 2 != 0:
             report.add(SyntaxIssue(
                 line_number=i,
@@ -493,63 +667,59 @@ def validate_skill_structure(content: str, lines: list[str], report: SyntaxRepor
     if not is_skill_file:
         return
     # Check for H1 heading after frontmatter
-    in_frontmatter = content.startswith("---")
-    found_h1 = False
-    frontmatter_closed = False
-
-    for i, line in enumerate(lines, start=1):
-        if in_frontmatter:
-            if i > 1 and line.strip() == "---":
-                frontmatter_closed = True
-                in_frontmatter = False
-            continue
+    if not content.startswith("---"):
+        return
 
-        if frontmatter_closed and not found_h1:
-            if line.strip().startswith("# "):
-                found_h1 = True
-            elif line.strip() and not line.strip().startswith("#"):
-                # Non-empty, non-heading content before H1
-                report.add(SyntaxIssue(
-                    line_number=i,
-                    category="Skill Structure",
-                    severity="warning",
-                    message="Content appears before main heading (H1)",
-                    context=line.strip()
-                ))
-                break
+    # Only the frontmatter and the lines up to the first H1 are visited;
+    # nothing after the H1 affects this check
+    closing_line = None
+    for i, line in enumerate(islice(lines, 1, None), start=2):
+        if line.strip() == "---":
+            closing_line = i
+            break
+    if closing_line is None:
+        return
 
-    if frontmatter_closed and not found_h1:
-        # Check if there's any H1 at all
-        if not re.search(r'^# ', content, re.MULTILINE):
+    for i, line in enumerate(islice(lines, closing_line, None), start=closing_line + 1):
+        stripped = line.strip()
+        if stripped.startswith("# "):
+            return
+        if stripped and not stripped.startswith("#"):
+            # Non-empty, non-heading content before H1
             report.add(SyntaxIssue(
-                line_number=1,
+                line_number=i,
                 category="Skill Structure",
                 severity="warning",
-                message="Skill file should have a main heading (# Title)"
+                message="Content appears before main heading (H1)",
+                context=stripped
             ))
+            break
 
+    # Check if there's any H1 at all
+    if not _H1_RE.search(content):
+        report.add(SyntaxIssue(
+            line_number=1,
+            category="Skill Structure",
+            severity="warning",
+            message="Skill file should have a main heading (# Title)"
+        ))
 
-def validate_inline_code(lines: list[str], report: SyntaxReport):
-    """Validate inline code backtick matching."""
-    in_code_block = False
-
-    for i, line in enumerate(lines, start=1):
-        if line.strip().startswith("```"):
-            in_code_block = not in_code_block
-            continue
 
-        if in_code_block:
-            continue
+def validate_inline_code(lines: list[str], report: SyntaxReport,
+                         scan: Optional[LineScan] = None):
+    """Validate inline code backtick matching."""
+    if scan is None:
+        scan = scan_lines(lines)
 
+    for i, line in scan.prose:
         # Skip table cells that describe code block syntax (e.g., "Matched ``` delimiters")
         # These intentionally show backtick characters as content
         if '|' in line and '```' in line:
             continue
 
-        # Remove matched inline code spans first, then count remaining
-        line_processed = re.sub(r'`[^`]+`', '', line)
-        backtick_count = line_processed.count('`')
-        if backtick_count % 2 != 0:
+        # Removing a matched span drops exactly two backticks, so the count
+        # left after stripping spans has the same parity as the raw count
+        if line.count('`') % 2 != 0:
             report.add(SyntaxIssue(
                 line_number=i,
                 category="Inline Code",
@@ -559,13 +729,21 @@ def validate_inline_code(lines: list[str], report: SyntaxReport):
             ))
 
 
-def validate_syntax(file_path: Path) -> SyntaxReport:
-    """Run all syntax validations on a file."""
-    if not file_path.exists():
-        print(f"Error: File not found: {file_path}")
-        sys.exit(1)
+def validate_syntax(file_path: Path,
+                    text_cache: Optional[dict[Path, str]] = None) -> SyntaxReport:
+    """
+    Run all syntax validations on a file.
+
+    text_cache maps paths to text already read by the caller; a file found
+    there is not read from disk again.
+    """
+    content = text_cache.get(file_path) if text_cache else None
+    if content is None:
+        if not file_path.exists():
+            print(f"Error: File not found: {file_path}")
+            sys.exit(1)
 
-    content = file_path.read_text()
+        content = read_skill_text(file_path)
     lines = content.split('\n')
 
     report = SyntaxReport(file_path=file_path)
@@ -573,31 +751,137 @@ def validate_syntax(file_path: Path) -> SyntaxReport:
     # Determine if this is a SKILL.md file (requires frontmatter and skill structure)
     is_skill_file = file_path.name == "SKILL.md"
 
+    # Classify lines once and share the result across validators
+    scan = scan_lines(lines)
+
     # Run all validations
     validate_frontmatter_syntax(content, lines, report, is_skill_file)
-    validate_heading_hierarchy(lines, report)
-    validate_code_blocks(lines, report)
-    validate_links(lines, report)
-    validate_lists(lines, report)
-    validate_tables(lines, report)
-    validate_emphasis(lines, report)
-    validate_inline_code(lines, report)
+    validate_heading_hierarchy(lines, report, scan)
+    validate_code_blocks(lines, report, scan)
+    validate_links(lines, report, scan)
+    validate_lists(lines, report, scan)
+    validate_tables(lines, report, scan)
+    validate_emphasis(lines, report, scan)
+    validate_inline_code(lines, report, scan)
     validate_skill_structure(content, lines, report, is_skill_file)
 
     return report
 
 
-def validate_directory(dir_path: Path) -> list[SyntaxReport]:
-    """Validate all markdown files in a directory."""
-    reports = []
-    md_files = list(dir_path.glob("*.md"))
+def _validate_text(path: Path, text: Optional[str]) -> SyntaxReport:
+    """
+    Validate path, using text instead of the file when it is given.
+
+    The file is read here rather than by validate_syntax, so a missing
+    file raises FileNotFoundError instead of exiting the process.
+    """
+    if text is None:
+        text = read_skill_text(path)
+    return validate_syntax(path, {path: text})
+
+
+def _iter_validated(md_files: list[Path],
+                    text_cache: Optional[dict[Path, str]] = None,
+                    total_bytes: int = 0) -> Iterator[SyntaxReport]:
+    """
+    Yield validate_syntax reports in file order, from worker processes when worthwhile.
+
+    total_bytes is the combined size of md_files. Closing the generator
+    early cancels the files still queued for workers.
+    """
+    texts = [text_cache.get(path) if text_cache else None for path in md_files]
+    workers = min(os.cpu_count() or 1, len(md_files))
+    if workers < 2 or total_bytes < _MIN_PARALLEL_BYTES:
+        # Starting worker processes costs more than validating this much
+        yield from map(_validate_text, md_files, texts)
+        return
 
-    if not md_files:
+    # Imported here: the process pool machinery is the costliest import of
+    # this module and single-file runs never need it
+    from concurrent.futures import ProcessPoolExecutor
+
+    # Files are independent and validation is CPU-bound, so separate
+    # processes sidestep the GIL. map() keeps the reports in file order.
+    # Cached texts go to the workers with their paths; files without one
+    # are read by the worker.
+    chunksize = max(1, len(md_files) // (workers * 4))
+    pool = ProcessPoolExecutor(max_workers=workers)
+    try:
+        yield from pool.map(_validate_text, md_files, texts, chunksize=chunksize)
+    finally:
+        pool.shutdown(cancel_futures=True)
+
+
+def validate_directory(dir_path: Path,
+                       text_cache: Optional[dict[Path, str]] = None,
+                       fail_fast: bool = False,
+                       reuse_reports: bool = False) -> list[SyntaxReport]:
+    """
+    Validate all markdown files in a directory.
+
+    Files found in text_cache are validated from that text instead of disk.
+    With fail_fast=True validation stops at the first file (in name order)
+    that has errors; its report is the last one returned.
+
+    With reuse_reports=True reports are kept per file with its mtime and
+    size, so repeated calls (e.g. a watch loop) only re-validate files whose
+    stamp has changed. An edit that keeps the size within the filesystem's
+    mtime granularity goes unnoticed, which is why this is opt-in. Each call
+    returns its own copies of the kept reports; clear_report_cache() forgets
+    them. Files found in text_cache never use the kept reports.
+    """
+    # scandir entries carry the file type, and their stat() is reused for
+    # the sizes and cache stamps below, so each file is stat'ed at most once
+    with os.scandir(dir_path) as it:
+        entries = sorted(
+            (entry for entry in it if entry.name.endswith(".md") and entry.is_file()),
+            key=lambda entry: entry.name,
+        )
+
+    if not entries:
         print(f"No markdown files found in {dir_path}")
-        return reports
+        return []
+
+    # A report depends only on the file's name and contents
+    md_files = []
+    stamps = {}
+    stale = []
+    cacheable = set()
+    for entry in entries:
+        path = Path(entry.path)
+        md_files.append(path)
+        stat = entry.stat()
+        stamps[path] = stamp = (stat.st_mtime_ns, stat.st_size)
+        if not reuse_reports or (text_cache and path in text_cache):
+            stale.append(path)
+            continue
+        cacheable.add(path)
+        cached = _report_cache.get(path)
+        if cached is None or cached[0] != stamp:
+            stale.append(path)
+
+    # stale is in file order, so fresh reports arrive in the order needed
+    stale_paths = set(stale)
+    fresh = _iter_validated(stale, text_cache, sum(stamps[path][1] for path in stale))
+    reports = []
+    try:
+        for path in md_files:
+            if path in stale_paths:
+                report = next(fresh)
+                if path in cacheable:
+                    _report_cache.pop(path, None)
+                    _report_cache[path] = (stamps[path], report.copy())
+            else:
+                report = _report_cache[path][1].copy()
+            reports.append(report)
+            if fail_fast and not report.passed:
+                break
+    finally:
+        fresh.close()
 
-    for md_file in sorted(md_files):
-        reports.append(validate_syntax(md_file))
+    # Drop the least recently validated files beyond the cache size
+    while len(_report_cache) > _REPORT_CACHE_SIZE:
+        del _report_cache[next(iter(_report_cache))]
 
     return reports
 
@@ -614,7 +898,7 @@ def main():
         sys.exit(1)
 
     if path.is_dir():
-        reports = validate_directory(path)
+        reports = validate_directory(path, fail_fast="--fail-fast" in sys.argv)
         all_passed = all(r.passed for r in reports)
         for report in reports:
             report.print_report()